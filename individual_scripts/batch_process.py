@@ -0,0 +1,227 @@
+"""Run a Panko's Timesaver pipeline over many .blend / .vrm files, one Blender per file.
+
+Coordinator (inside Blender, or plain Python with --blender):
+    blender --background --python batch_process.py -- \
+        --pipeline create_arkit,add_to_vrm,assign_proxies,cleanup,rename \
+        --out-dir processed --output summary.json --jobs 8 avatars/*.blend avatars/*.vrm
+
+--pipeline takes comma-separated stage names or a .json file holding
+{"stages": [...], "meshes": [...]}. Without "meshes", stages run on the meshes that
+already have shape keys. Without --out-dir or --in-place nothing is saved (dry run). .vrm inputs are imported into an empty scene and saved as .blend.
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+# CLI stage → the add-on's pipeline stages (PIPELINE_STAGES) it runs
+STAGE_NAMES = {
+    "create_arkit":     ["create_arkit"],
+    "create_arkit_vrm": ["create_arkit_vrm"],
+    "add_to_vrm":       ["add_to_vrm"],
+    "assign_selected":  ["assign_selected"],
+    "assign_proxies":   ["assign_proxies"],
+    "cleanup":          ["remove_empty_vgroups", "cleanup_rig"],
+    "rename":           ["rename_lr"],
+}
+
+
+def script_args():
+    """Arguments after Blender's '--' separator (or all of them outside Blender)."""
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="batch_process.py", description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help=".blend or .vrm files to process")
+    parser.add_argument("--pipeline", required=True, help="Comma-separated stages or a .json spec file")
+    parser.add_argument("--output", default="batch_summary.json", help="JSON summary path")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Blender processes to run at once")
+    parser.add_argument("--out-dir", help="Save processed files here as .blend")
+    parser.add_argument("--in-place", action="store_true", help="Overwrite .blend inputs")
+    parser.add_argument("--timeout", type=float, help="Seconds before a file's Blender process is killed")
+    parser.add_argument("--blender", help="Blender executable (defaults to the running Blender or $BLENDER)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--input", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def load_pipeline(spec):
+    """Return (stages, mesh names) from a comma list or a .json spec file."""
+    if spec.endswith(".json"):
+        with open(spec) as f:
+            data = json.load(f)
+        stages, meshes = data.get("stages", []), data.get("meshes", [])
+    else:
+        stages, meshes = [s.strip() for s in spec.split(",") if s.strip()], []
+    unknown = [s for s in stages if s not in STAGE_NAMES]
+    if unknown:
+        raise SystemExit(f"Unknown stages: {', '.join(unknown)} (choose from {', '.join(STAGE_NAMES)})")
+    return stages, meshes
+
+
+# ==============================================================================
+#  WORKER  (runs inside one Blender process per file)
+# ==============================================================================
+
+def find_timesaver_addon():
+    """Return the loaded Panko's Timesaver module (installed as an extension or legacy add-on)."""
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[-1] == "panko_timesaver" and hasattr(module, "run_pipeline"):
+            return module
+    raise Exception("Enable Panko's Timesaver Plugin in the Blender preferences first.")
+
+
+# CLI stages that add shape keys
+CREATE_STAGES = {"create_arkit", "create_arkit_vrm"}
+
+
+def target_meshes(mesh_names, stages):
+    """Named meshes, else every mesh that already carries shape keys. Create stages never
+    guess further (clothes, hair and accessories would all get template keys), so a
+    file with no shape keys needs "meshes" in a .json spec."""
+    if mesh_names:
+        return [bpy.data.objects[n] for n in mesh_names if n in bpy.data.objects]
+    meshes = [o for o in bpy.data.objects if o.type == 'MESH' and o.data.shape_keys]
+    if not meshes and CREATE_STAGES.intersection(stages):
+        raise Exception('No mesh has shape keys yet; list the face mesh under "meshes" in a .json pipeline spec.')
+    return meshes
+
+
+def run_worker(args):
+    start = time.perf_counter()
+    result = {"file": args.input, "ok": False, "stages": [], "saved": None, "error": None}
+    try:
+        addon = find_timesaver_addon()
+        stages, mesh_names = load_pipeline(args.pipeline)
+        if args.input.lower().endswith(".vrm"):
+            bpy.ops.wm.read_homefile(use_empty=True)
+            bpy.ops.import_scene.vrm(filepath=args.input)
+
+        # One shared pipeline context for the whole file instead of an operator per stage
+        pipeline = [p for s in stages for p in STAGE_NAMES[s]]
+        for stage, message, seconds in addon.run_pipeline(bpy.context, pipeline, target_meshes(mesh_names, stages)):
+            result["stages"].append({"stage": stage, "result": message, "seconds": round(seconds, 3)})
+
+        if args.out_dir:
+            os.makedirs(args.out_dir, exist_ok=True)
+            name = os.path.splitext(os.path.basename(args.input))[0] + ".blend"
+            result["saved"] = os.path.abspath(os.path.join(args.out_dir, name))
+        elif args.in_place and args.input.lower().endswith(".blend"):
+            result["saved"] = os.path.abspath(args.input)
+        if result["saved"]:
+            bpy.ops.wm.save_as_mainfile(filepath=result["saved"])
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    with open(args.result, "w") as f:
+        json.dump(result, f, indent=2)
+
+
+# ==============================================================================
+#  COORDINATOR  (fans the files out, one Blender process each)
+# ==============================================================================
+
+def blender_executable(args):
+    if args.blender:
+        return args.blender
+    if bpy is not None and bpy.app.binary_path:
+        return bpy.app.binary_path
+    return os.environ.get("BLENDER", "blender")
+
+
+def process_file(i, path, args, blender, result_dir):
+    result_path = os.path.join(result_dir, f"{i}.json")
+    cmd = [blender, "--background"]
+    if path.lower().endswith(".blend"):
+        cmd.append(path)
+    cmd += ["--python", os.path.abspath(__file__), "--", "--worker",
+            "--pipeline", args.pipeline, "--input", path, "--result", result_path]
+    if args.out_dir:
+        cmd += ["--out-dir", args.out_dir]
+    if args.in_place:
+        cmd.append("--in-place")
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=args.timeout)
+        log_tail = (proc.stdout + proc.stderr).strip().splitlines()[-20:]
+    except subprocess.TimeoutExpired:
+        proc, log_tail = None, [f"Timed out after {args.timeout}s"]
+    if os.path.exists(result_path):
+        with open(result_path) as f:
+            result = json.load(f)
+    else:
+        result = {"file": path, "ok": False, "stages": [], "saved": None,
+                  "error": "Blender exited without writing a result"}
+    result["returncode"] = proc.returncode if proc else None
+    result["wall_seconds"] = round(time.perf_counter() - start, 3)
+    if not result["ok"]:
+        result["log"] = log_tail
+    return result
+
+
+def run_coordinator(args):
+    if not args.files:
+        raise SystemExit("No input files given.")
+    load_pipeline(args.pipeline)  # fail fast on a bad spec
+    # Workers run with the .blend's folder as cwd, so hand them absolute paths
+    if args.pipeline.endswith(".json"):
+        args.pipeline = os.path.abspath(args.pipeline)
+    if args.out_dir:
+        args.out_dir = os.path.abspath(args.out_dir)
+    blender = blender_executable(args)
+    files = [os.path.abspath(p) for p in args.files]
+    start = time.perf_counter()
+
+    # Each task only waits on its own Blender subprocess, so threads are enough to keep
+    # one Blender process per file running on every core
+    with tempfile.TemporaryDirectory() as result_dir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            futures = [pool.submit(process_file, i, p, args, blender, result_dir) for i, p in enumerate(files)]
+            results = []
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results.append(result)
+                status = "OK  " if result["ok"] else "FAIL"
+                print(f"[{len(results)}/{len(files)}] {status} {os.path.basename(result['file'])} "
+                      f"({result['wall_seconds']:.1f}s)")
+
+    results.sort(key=lambda r: files.index(r["file"]))
+    summary = {
+        "pipeline": args.pipeline,
+        "jobs": args.jobs,
+        "seconds": round(time.perf_counter() - start, 3),
+        "succeeded": sum(1 for r in results if r["ok"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+        "files": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print("\n" + "="*50)
+    print("Batch Processing Complete!")
+    print(f"Files: {len(files)}  Succeeded: {summary['succeeded']}  Failed: {summary['failed']}")
+    print(f"Time: {summary['seconds']:.1f}s with {args.jobs} Blender processes")
+    print(f"Summary: {os.path.abspath(args.output)}")
+    print("="*50)
+
+
+# Run the script
+if __name__ == "__main__":
+    arguments = parse_args(script_args())
+    if arguments.worker:
+        run_worker(arguments)
+    else:
+        run_coordinator(arguments)
@@ -0,0 +1,100 @@
+import sys
+import time
+
+import bpy
+import numpy as np
+
+# Rig size: Driver keys x Target meshes (70 x 12 = 840 drivers in Drivers mode)
+SHAPE_COUNT = 70
+TARGET_COUNT = 12
+FRAME_COUNT = 120
+
+
+def find_timesaver_addon():
+    """Return the loaded Panko's Timesaver module (installed as an extension or legacy add-on)."""
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[-1] == "panko_timesaver" and hasattr(module, "sync_linked_shape_values"):
+            return module
+    raise Exception("Enable Panko's Timesaver Plugin first.")
+
+
+def add_shape_mesh(name, location):
+    """Small sphere with Basis plus SHAPE_COUNT randomly displaced keys."""
+    bpy.ops.mesh.primitive_uv_sphere_add(segments=32, ring_count=16, location=location)
+    obj = bpy.context.active_object
+    obj.name = name
+    obj.shape_key_add(name="Basis", from_mix=False)
+    rng = np.random.default_rng(len(bpy.data.objects))
+    for i in range(SHAPE_COUNT):
+        shape = obj.shape_key_add(name=f"benchShape{i:02d}", from_mix=False)
+        coords = np.empty(len(shape.data) * 3, dtype=np.float32)
+        shape.data.foreach_get("co", coords)
+        coords += rng.uniform(-0.05, 0.05, coords.size).astype(np.float32)
+        shape.data.foreach_set("co", coords)
+    return obj
+
+
+def build_test_rig(scene):
+    """Driver mesh with a keyframe on every key value each frame, plus TARGET_COUNT Targets."""
+    driver = add_shape_mesh("LinkBenchDriver", (0, 0, 0))
+    rng = np.random.default_rng(0)
+    for kb in driver.data.shape_keys.key_blocks[1:]:
+        for frame in range(1, FRAME_COUNT + 1, 10):
+            kb.value = float(rng.uniform(0.0, 1.0))
+            kb.keyframe_insert("value", frame=frame)
+
+    scene.ak_driver_mesh = driver
+    scene.ak_targets.clear()
+    for i in range(TARGET_COUNT):
+        scene.ak_targets.add().obj = add_shape_mesh(f"LinkBenchTarget{i:02d}", (3 * (i + 1), 0, 0))
+    return driver
+
+
+def time_playback(scene):
+    """Step through every frame and return the mean seconds per frame."""
+    scene.frame_set(1)
+    start = time.perf_counter()
+    for frame in range(1, FRAME_COUNT + 1):
+        scene.frame_set(frame)
+    return (time.perf_counter() - start) / FRAME_COUNT
+
+
+def targets_match_driver(scene):
+    """True when every Target key value equals the Driver key of the same name."""
+    src_kb = scene.ak_driver_mesh.data.shape_keys.key_blocks
+    return all(
+        abs(kb.value - src_kb[kb.name].value) < 1e-6
+        for t in scene.ak_targets for kb in t.obj.data.shape_keys.key_blocks[1:]
+    )
+
+
+def run_benchmark():
+    find_timesaver_addon()
+    scene = bpy.context.scene
+    build_test_rig(scene)
+
+    scene.ak_link_mode = 'DRIVERS'
+    bpy.ops.ak.create_drivers()
+    driver_time = time_playback(scene)
+    driver_ok = targets_match_driver(scene)
+    bpy.ops.ak.remove_drivers()
+
+    scene.ak_link_mode = 'SYNC'
+    bpy.ops.ak.create_drivers()
+    sync_time = time_playback(scene)
+    sync_ok = targets_match_driver(scene)
+    bpy.ops.ak.remove_drivers()
+
+    print("\n" + "="*50)
+    print("Driver Link Benchmark")
+    print(f"Driver keys: {SHAPE_COUNT}  Targets: {TARGET_COUNT}  Frames: {FRAME_COUNT}")
+    print(f"Drivers:   {driver_time * 1000:.2f} ms/frame ({SHAPE_COUNT * TARGET_COUNT} drivers)")
+    print(f"Bulk sync: {sync_time * 1000:.2f} ms/frame")
+    print(f"Speed-up:  {driver_time / max(sync_time, 1e-9):.1f}x")
+    print(f"Targets follow Driver — drivers: {driver_ok}, bulk sync: {sync_ok}")
+    print("="*50)
+
+
+# Run the script
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,67 @@
+import sys
+import time
+
+import bpy
+import numpy as np
+
+# Grid resolution of the generated test mesh (200 x 200 ≈ 40k vertices)
+GRID_SIZE = 200
+SOURCE_GROUP = "benchSource"
+TARGET_GROUP = "benchTarget"
+
+
+def find_timesaver_addon():
+    """Return the loaded Panko's Timesaver module (installed as an extension or legacy add-on)."""
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[-1] == "panko_timesaver" and hasattr(module, "merge_vertex_groups"):
+            return module
+    raise Exception("Enable Panko's Timesaver Plugin first.")
+
+
+def build_test_mesh():
+    """Dense grid with two vertex groups holding continuous random (painted-like) weights."""
+    bpy.ops.mesh.primitive_grid_add(
+        x_subdivisions=GRID_SIZE, y_subdivisions=GRID_SIZE, size=2.0, location=(0, 0, 0)
+    )
+    obj = bpy.context.active_object
+    obj.name = "MergeBenchmark"
+    rng = np.random.default_rng(0)
+    count = len(obj.data.vertices)
+    weights = {}
+    for name in (SOURCE_GROUP, TARGET_GROUP):
+        vg = obj.vertex_groups.new(name=name)
+        w = rng.uniform(0.0, 0.7, count).astype(np.float32)
+        w[rng.random(count) < 0.2] = 0.0
+        for i in np.flatnonzero(w):
+            vg.add([int(i)], float(w[i]), 'REPLACE')
+        weights[name] = w
+    return obj, weights
+
+
+def run_benchmark():
+    addon = find_timesaver_addon()
+    obj, weights = build_test_mesh()
+    expected = np.minimum(weights[SOURCE_GROUP] + weights[TARGET_GROUP], 1.0)
+
+    start = time.perf_counter()
+    add_calls = addon.merge_vertex_groups(obj, {SOURCE_GROUP: TARGET_GROUP})
+    merge_time = time.perf_counter() - start
+
+    result = addon.read_vertex_group_weights(obj, TARGET_GROUP)
+    error = float(np.abs(result - expected).max())
+    # Rounded to WEIGHT_QUANTUM; tiny weights round up to one step rather than to 0
+    matches = error <= addon.WEIGHT_QUANTUM and np.array_equal(result > 0, expected > 0)
+
+    print("\n" + "="*50)
+    print("Vertex Group Merge Benchmark")
+    print(f"Vertices: {len(obj.data.vertices)}")
+    print(f"Merge:     {merge_time * 1000:.1f} ms")
+    print(f"add calls: {add_calls} (limit {round(1 / addon.WEIGHT_QUANTUM)})")
+    print(f"Max weight error: {error:.6f}")
+    print(f"Weights match: {matches and add_calls <= round(1 / addon.WEIGHT_QUANTUM)}")
+    print("="*50)
+
+
+# Run the script
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,92 @@
+import sys
+import time
+
+import bpy
+import numpy as np
+
+# Grid resolution of the generated test mesh (350 x 350 ≈ 122k vertices)
+GRID_SIZE = 350
+SHAPE_NAME = "benchSplit"
+
+
+def find_timesaver_addon():
+    """Return the loaded Panko's Timesaver module (installed as an extension or legacy add-on)."""
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[-1] == "panko_timesaver" and hasattr(module, "split_shape_key"):
+            return module
+    raise Exception("Enable Panko's Timesaver Plugin first.")
+
+
+def build_test_mesh():
+    """Create a dense grid centred on X = 0 with Basis and one randomly displaced shape."""
+    bpy.ops.mesh.primitive_grid_add(
+        x_subdivisions=GRID_SIZE, y_subdivisions=GRID_SIZE, size=2.0, location=(0, 0, 0)
+    )
+    obj = bpy.context.active_object
+    obj.name = "SplitBenchmark"
+    obj.shape_key_add(name="Basis", from_mix=False)
+    shape = obj.shape_key_add(name=SHAPE_NAME, from_mix=False)
+
+    count = len(shape.data)
+    coords = np.empty(count * 3, dtype=np.float32)
+    shape.data.foreach_get("co", coords)
+    coords += np.random.default_rng(0).uniform(-0.01, 0.01, count * 3).astype(np.float32)
+    shape.data.foreach_set("co", coords)
+    return obj
+
+
+def legacy_split(obj, shape_name, left_name, right_name):
+    """The original per-vertex loop from AK_OT_mirror_blendshape, kept for comparison."""
+    kb = obj.data.shape_keys.key_blocks
+    target_shape = kb.get(shape_name)
+    basis = kb.get("Basis")
+    for n in (left_name, right_name):
+        if n in kb:
+            obj.shape_key_remove(kb[n])
+    left_shape  = obj.shape_key_add(name=left_name,  from_mix=False)
+    right_shape = obj.shape_key_add(name=right_name, from_mix=False)
+    for i, v in enumerate(obj.data.vertices):
+        b_co = basis.data[i].co
+        s_co = target_shape.data[i].co
+        if b_co.x > 0.001:
+            right_shape.data[i].co = s_co
+            left_shape.data[i].co  = b_co
+        elif b_co.x < -0.001:
+            left_shape.data[i].co  = s_co
+            right_shape.data[i].co = b_co
+        else:
+            left_shape.data[i].co  = b_co
+            right_shape.data[i].co = b_co
+
+
+def run_benchmark():
+    addon = find_timesaver_addon()
+    obj = build_test_mesh()
+    kb = obj.data.shape_keys.key_blocks
+
+    start = time.perf_counter()
+    legacy_split(obj, SHAPE_NAME, "legacyLeft", "legacyRight")
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    addon.split_shape_key(obj, SHAPE_NAME, "fastLeft", "fastRight")
+    fast_time = time.perf_counter() - start
+
+    matches = all(
+        np.array_equal(addon.read_shape_coords(kb[a]), addon.read_shape_coords(kb[b]))
+        for a, b in (("legacyLeft", "fastLeft"), ("legacyRight", "fastRight"))
+    )
+
+    print("\n" + "="*50)
+    print("Left/Right Split Benchmark")
+    print(f"Vertices: {len(obj.data.vertices)}")
+    print(f"Legacy loop: {legacy_time * 1000:.1f} ms")
+    print(f"Vectorized:  {fast_time * 1000:.1f} ms")
+    print(f"Speed-up:    {legacy_time / max(fast_time, 1e-9):.1f}x")
+    print(f"Identical output: {matches}")
+    print("="*50)
+
+
+# Run the script
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,3 +1,5 @@
+import time
+
 import bpy
 
 # All 52 ARKit blendshapes in correct naming convention+ VRMS
@@ -96,44 +98,41 @@ arkit_blendshapes = [
 ]
 
 def create_arkit_blendshapes():
-    # Get the active object
+    # Every selected mesh, falling back to the active object
+    meshes = [o for o in bpy.context.selected_objects if o.type == 'MESH']
     obj = bpy.context.active_object
+    if not meshes and obj and obj.type == 'MESH':
+        meshes.append(obj)
 
-    # Check if an object is selected
-    if obj is None:
-        print("ERROR: No object selected!")
-        return
-
-    # Check if the selected object is a mesh
-    if obj.type != 'MESH':
-        print(f"ERROR: Selected object '{obj.name}' is not a mesh!")
+    if not meshes:
+        print("ERROR: No mesh selected!")
         return
 
-    # Create basis shape key if it doesn't exist
-    if obj.data.shape_keys is None:
-        obj.shape_key_add(name="Basis", from_mix=False)
-        print(f"Created Basis shape key on '{obj.name}'")
-
-    # Create all ARKit blendshapes
+    start = time.perf_counter()
     created_count = 0
     skipped_count = 0
 
-    for shape_name in arkit_blendshapes:
-        # Check if shape key already exists
-        if obj.data.shape_keys.key_blocks.get(shape_name):
-            print(f"Skipped: '{shape_name}' already exists")
-            skipped_count += 1
-        else:
-            obj.shape_key_add(name=shape_name, from_mix=False)
-            print(f"Created: '{shape_name}'")
-            created_count += 1
+    for mesh_obj in meshes:
+        # Create basis shape key if it doesn't exist
+        if mesh_obj.data.shape_keys is None:
+            mesh_obj.shape_key_add(name="Basis", from_mix=False)
+
+        # One set per mesh instead of a key_blocks lookup per name
+        existing = set(mesh_obj.data.shape_keys.key_blocks.keys())
+        missing = [name for name in arkit_blendshapes if name not in existing]
+        for shape_name in missing:
+            mesh_obj.shape_key_add(name=shape_name, from_mix=False)
+        print(f"{mesh_obj.name}: created {len(missing)}, skipped {len(arkit_blendshapes) - len(missing)}")
+        created_count += len(missing)
+        skipped_count += len(arkit_blendshapes) - len(missing)
 
     print("\n" + "="*50)
     print(f"ARKit Blendshapes Creation Complete!")
-    print(f"Object: '{obj.name}'")
+    print(f"Meshes: {len(meshes)}")
     print(f"Created: {created_count} shape keys")
     print(f"Skipped: {skipped_count} (already existed)")
     print(f"Total ARKit blendshapes: {len(arkit_blendshapes)}")
+    print(f"Time: {time.perf_counter() - start:.2f}s")
     print("="*50)
 
 # Run the script
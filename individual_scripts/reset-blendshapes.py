@@ -1,44 +1,63 @@
 import bpy
+import numpy as np
 
-def reset_all_blendshapes():
-    # Get the active object
-    obj = bpy.context.active_object
 
-    # Check if an object is selected
-    if obj is None:
-        print("ERROR: No object selected!")
-        return
+def driven_key_mask(shape_keys):
+    """Bool array marking key blocks whose value has an unmuted driver."""
+    key_blocks = shape_keys.key_blocks
+    mask = np.zeros(len(key_blocks), dtype=bool)
+    anim = shape_keys.animation_data
+    if anim and anim.drivers:
+        paths = {kb.path_from_id("value"): i for i, kb in enumerate(key_blocks)}
+        for fc in anim.drivers:
+            i = paths.get(fc.data_path)
+            if i is not None and not fc.mute:
+                mask[i] = True
+    return mask
 
-    # Check if the selected object is a mesh
-    if obj.type != 'MESH':
-        print(f"ERROR: Selected object '{obj.name}' is not a mesh!")
-        return
 
-    # Check if object has shape keys
-    if obj.data.shape_keys is None:
-        print(f"ERROR: Object '{obj.name}' has no shape keys!")
+def reset_all_blendshapes():
+    # Every selected mesh, falling back to the active object
+    meshes = [o for o in bpy.context.selected_objects if o.type == 'MESH']
+    obj = bpy.context.active_object
+    if not meshes and obj and obj.type == 'MESH':
+        meshes.append(obj)
+
+    if not meshes:
+        print("ERROR: No mesh selected!")
         return
 
-    # Reset all shape keys to 0
     reset_count = 0
-
-    for shape_key in obj.data.shape_keys.key_blocks:
-        # Skip the Basis shape key (it doesn't have a value)
-        if shape_key.name == "Basis":
+    skipped_driven = 0
+    for mesh_obj in meshes:
+        shape_keys = mesh_obj.data.shape_keys
+        if shape_keys is None:
+            print(f"Skipped '{mesh_obj.name}': no shape keys")
             continue
 
-        # Set value to 0
-        shape_key.value = 0.0
-        print(f"Reset: '{shape_key.name}' → 0.0")
-        reset_count += 1
+        key_blocks = shape_keys.key_blocks
+        values = np.empty(len(key_blocks), dtype=np.float32)
+        key_blocks.foreach_get("value", values)
+
+        # Basis (the reference key) has no value of its own; driven keys would be overwritten anyway
+        keep = driven_key_mask(shape_keys)
+        skipped_driven += int(np.count_nonzero(keep[1:]))
+        keep[0] = True
+
+        reset = ~keep & (values != 0.0)
+        if reset.any():
+            values[reset] = 0.0
+            key_blocks.foreach_set("value", values)
+            shape_keys.update_tag()
+        reset_count += int(np.count_nonzero(reset))
 
     print("\n" + "="*50)
-    print(f"Blendshapes Reset Complete!")
-    print(f"Object: '{obj.name}'")
+    print("Blendshapes Reset Complete!")
+    print(f"Meshes: {len(meshes)}")
     print(f"Reset: {reset_count} blendshapes to 0%")
+    print(f"Skipped driven: {skipped_driven}")
     print("="*50)
 
 # Run the script
 if __name__ == "__main__":
     reset_all_blendshapes()
-                            
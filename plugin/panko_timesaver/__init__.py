@@ -0,0 +1,3593 @@
+bl_info = {
+    "name": "Panko's Timesaver Plugin",
+    "author": "Panko",
+    "version": (5, 1, 0),
+    "blender": (5, 1, 0),
+    "location": "View3D > Sidebar > ARKit H  |  Helper Scripts",
+    "description": "Unified ARKit blendshape management, VRM expression tools, and mesh cleanup utilities",
+    "doc_url": "https://github.com/panekopanko/pankosvrmblenderscripts",
+    "category": "Rigging",
+}
+
+import time
+import zipfile
+import zlib
+from collections import namedtuple
+
+import bpy
+import bmesh
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from mathutils import Vector
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import StringProperty, CollectionProperty, IntProperty, BoolProperty, PointerProperty, FloatProperty, EnumProperty
+
+# ==============================================================================
+#  CONSTANTS
+# ==============================================================================
+
+ARKIT_DEFAULTS = {
+    "Brows": [
+        "browDown", "browDownLeft", "browDownRight",
+        "browInnerUp", "browOuterUp", "browOuterUpLeft", "browOuterUpRight",
+    ],
+    "Eyes": [
+        "eyeBlink", "eyeBlinkLeft", "eyeBlinkRight",
+        "eyeLookDown", "eyeLookDownLeft", "eyeLookDownRight",
+        "eyeLookIn", "eyeLookInLeft", "eyeLookInRight",
+        "eyeLookOut", "eyeLookOutLeft", "eyeLookOutRight",
+        "eyeLookUp", "eyeLookUpLeft", "eyeLookUpRight",
+        "eyeSquint", "eyeSquintLeft", "eyeSquintRight",
+        "eyeWide", "eyeWideLeft", "eyeWideRight",
+    ],
+    "Cheeks": ["cheekPuff", "cheekSquint", "cheekSquintLeft", "cheekSquintRight"],
+    "Jaw":    ["jawForward", "jawLeft", "jawRight", "jawOpen"],
+    "Mouth": [
+        "mouthClose", "mouthFunnel", "mouthPucker", "mouthLeft", "mouthRight",
+        "mouthSmile", "mouthSmileLeft", "mouthSmileRight",
+        "mouthFrown", "mouthFrownLeft", "mouthFrownRight",
+        "mouthDimple", "mouthDimpleLeft", "mouthDimpleRight",
+        "mouthStretch", "mouthStretchLeft", "mouthStretchRight",
+        "mouthRollLower", "mouthRollUpper", "mouthShrugLower", "mouthShrugUpper",
+        "mouthPress", "mouthPressLeft", "mouthPressRight",
+        "mouthLowerDown", "mouthLowerDownLeft", "mouthLowerDownRight",
+        "mouthUpperUp", "mouthUpperUpLeft", "mouthUpperUpRight",
+        "tongueOut",
+    ],
+    "Nose":  ["noseSneer", "noseSneerRight", "noseSneerLeft"],
+    "Other": [],
+}
+
+VRM_DEFAULTS = {
+    "Emotions": ["happy", "angry", "sad", "relaxed", "surprised", "neutral"],
+    "Visemes":  ["aa", "ih", "ou", "ee", "oh"],
+    "Blink":    ["blink", "blinkLeft", "blinkRight"],
+    "Look":     ["lookUp", "lookDown", "lookLeft", "lookRight"],
+}
+
+# Flat ARKit list used by VRM tools
+ARKIT_BLENDSHAPES = [s for cat in ARKIT_DEFAULTS.values() for s in cat if cat]
+# Remove duplicates introduced by the "Other" empty list while preserving order
+_seen = set()
+ARKIT_BLENDSHAPES = [s for s in ARKIT_BLENDSHAPES if not (s in _seen or _seen.add(s))]
+
+# Symmetric ARKit shapes that get split into <name>Left / <name>Right
+ARKIT_UNMIRRORED = [
+    s for s in ARKIT_BLENDSHAPES if s + "Left" in _seen and s + "Right" in _seen
+]
+
+ARKIT_VRM_BLENDSHAPES = (
+    [s for cat in VRM_DEFAULTS.values() for s in cat]
+    + ARKIT_BLENDSHAPES
+)
+
+
+# ==============================================================================
+#  SHARED UTILITIES
+# ==============================================================================
+
+def get_vrm_armature_and_extension():
+    """Return (armature_data, armature_obj, vrm_extension) or (None, None, None).
+    Searches all armature objects for one with a VRM 1.0 extension — does not
+    rely on the armature being named 'Armature'."""
+    for obj in bpy.data.objects:
+        if obj.type != 'ARMATURE':
+            continue
+        arm = obj.data
+        if not hasattr(arm, "vrm_addon_extension"):
+            continue
+        ext = arm.vrm_addon_extension
+        if not hasattr(ext, "vrm1"):
+            continue
+        return arm, obj, ext
+    return None, None, None
+
+
+# Cached answers for poll()/draw(), rebuilt lazily after the handlers below invalidate them
+_vrm_scene_cache = {
+    "valid":        False,
+    "armature":     None,         # VRM armature object name
+    "shape_meshes": frozenset(),  # names of mesh objects with shape keys
+    "fingerprint":  None,
+}
+
+
+def _data_fingerprint():
+    """Datablock counts that change whenever objects, armatures or shape key sets come or go."""
+    return len(bpy.data.objects), len(bpy.data.armatures), len(bpy.data.shape_keys)
+
+
+def _rebuild_vrm_scene_cache():
+    _, arm_obj, _ = get_vrm_armature_and_extension()
+    _vrm_scene_cache.update(
+        valid=True,
+        armature=arm_obj.name if arm_obj else None,
+        shape_meshes=frozenset(
+            o.name for o in bpy.data.objects if o.type == 'MESH' and o.data.shape_keys
+        ),
+        fingerprint=_data_fingerprint(),
+    )
+
+
+def invalidate_vrm_scene_cache():
+    _vrm_scene_cache["valid"] = False
+
+
+def cached_vrm_armature_and_extension():
+    """get_vrm_armature_and_extension() served from the scene cache, for poll()/draw()."""
+    if not _vrm_scene_cache["valid"]:
+        _rebuild_vrm_scene_cache()
+    name = _vrm_scene_cache["armature"]
+    obj = bpy.data.objects.get(name) if name else None
+    if name and (obj is None or obj.type != 'ARMATURE'):
+        # Renamed or replaced since the last rebuild
+        _rebuild_vrm_scene_cache()
+        name = _vrm_scene_cache["armature"]
+        obj = bpy.data.objects.get(name) if name else None
+    if obj is None or not hasattr(obj.data, "vrm_addon_extension"):
+        return None, None, None
+    return obj.data, obj, obj.data.vrm_addon_extension
+
+
+def vrm_scene_has_shape_meshes():
+    """True when any mesh object has shape keys, answered from the scene cache."""
+    if not _vrm_scene_cache["valid"]:
+        _rebuild_vrm_scene_cache()
+    return bool(_vrm_scene_cache["shape_meshes"])
+
+
+@persistent
+def _vrm_cache_depsgraph_update(_scene, depsgraph):
+    if (depsgraph.id_type_updated('ARMATURE')
+            or _data_fingerprint() != _vrm_scene_cache["fingerprint"]):
+        invalidate_vrm_scene_cache()
+
+
+@persistent
+def _vrm_cache_reset(_dummy):
+    invalidate_vrm_scene_cache()
+
+
+def bind_mesh_name(bind):
+    """Name of the mesh object a VRM morph target bind points at ('' if unset)."""
+    obj = getattr(bind.node, "bpy_object", None)
+    return obj.name if obj else getattr(bind.node, "mesh_object_name", "")
+
+
+class VRMExpressionIndex:
+    """custom_name → expression lookup plus the set of existing (name, mesh, shape)
+    binds for a VRM 1.0 expressions block. Build it once per operator run and keep
+    it current through add_expression() / note_bind().
+
+    Expressions are stored by position and resolved on access: holding on to
+    collection items across custom.add() is unsafe in Blender."""
+
+    def __init__(self, expressions):
+        self.expressions = expressions
+        self.positions = {}
+        self.binds = set()
+        for i, expr in enumerate(expressions.custom):
+            self.positions.setdefault(expr.custom_name, i)
+            for b in expr.morph_target_binds:
+                self.binds.add((expr.custom_name, bind_mesh_name(b), b.index))
+
+    def __contains__(self, name):
+        return name in self.positions
+
+    def get(self, name):
+        i = self.positions.get(name)
+        return None if i is None else self.expressions.custom[i]
+
+    def add_expression(self, name):
+        expr = self.expressions.custom.add()
+        expr.custom_name = name
+        self.positions[name] = len(self.expressions.custom) - 1
+        return expr
+
+    def has_bind(self, name, mesh_name, shape_name):
+        return (name, mesh_name, shape_name) in self.binds
+
+    def note_bind(self, name, mesh_name, shape_name):
+        self.binds.add((name, mesh_name, shape_name))
+
+
+def set_bind_target(bind, mesh_obj, shape_name, weight=1.0):
+    """Point a VRM morph target bind at shape_name on mesh_obj."""
+    if hasattr(bind.node, "bpy_object"):
+        bind.node.bpy_object = mesh_obj
+    else:
+        bind.node.mesh_object_name = mesh_obj.name
+    bind.index  = shape_name
+    bind.weight = weight
+
+
+def write_morph_target_binds(armature_obj, index, binds, weight=1.0, counts=None):
+    """Add (expression name, mesh object, shape name) binds in one pass, appending
+    straight to each expression's morph_target_binds. Unknown expressions and binds
+    that already exist are skipped. If the installed VRM add-on rejects direct writes,
+    the rest go through vrm.add_vrm1_expression_morph_target_bind.
+    Returns (assigned, skipped); counts, if given, collects assigned binds per mesh name."""
+    assigned = skipped = 0
+    use_operator = False
+    for name, mesh_obj, shape_name in binds:
+        if name not in index or index.has_bind(name, mesh_obj.name, shape_name):
+            skipped += 1
+            continue
+        if not use_operator:
+            binds_coll = index.get(name).morph_target_binds
+            try:
+                set_bind_target(binds_coll.add(), mesh_obj, shape_name, weight)
+            except (AttributeError, TypeError):
+                if len(binds_coll) and not binds_coll[-1].index:
+                    binds_coll.remove(len(binds_coll) - 1)
+                use_operator = True
+        if use_operator:
+            try:
+                bpy.ops.vrm.add_vrm1_expression_morph_target_bind(
+                    armature_object_name=armature_obj.name,
+                    expression_name=name,
+                )
+                set_bind_target(index.get(name).morph_target_binds[-1], mesh_obj, shape_name, weight)
+            except Exception:
+                skipped += 1
+                continue
+        index.note_bind(name, mesh_obj.name, shape_name)
+        assigned += 1
+        if counts is not None:
+            counts[mesh_obj.name] = counts.get(mesh_obj.name, 0) + 1
+    return assigned, skipped
+
+
+def get_vrm_shape_meshes(armature_obj):
+    """Meshes with shape keys that belong to the VRM armature (parented to it or
+    deformed by it). Falls back to every mesh with shape keys when none do."""
+    meshes = [o for o in bpy.data.objects if o.type == 'MESH' and o.data.shape_keys]
+    bound = [
+        o for o in meshes
+        if o.parent == armature_obj or get_mesh_armature(o) == armature_obj
+    ]
+    return bound or meshes
+
+
+def build_shape_mesh_index(meshes, names):
+    """Return {shape name: [meshes that have it]} for the given names, in mesh order."""
+    wanted = set(names)
+    index = {}
+    for obj in meshes:
+        for key in obj.data.shape_keys.key_blocks:
+            if key.name in wanted:
+                index.setdefault(key.name, []).append(obj)
+    return index
+
+
+def get_mesh_armature(obj):
+    """Return the armature object of the mesh's first Armature modifier, or None."""
+    return next(
+        (m.object for m in obj.modifiers if m.type == 'ARMATURE' and m.object),
+        None,
+    )
+
+
+def shape_value_path(shape_name):
+    """RNA path of a shape key's value, relative to its Key datablock."""
+    return f'key_blocks["{bpy.utils.escape_identifier(shape_name)}"].value'
+
+
+def find_value_driver(key_block):
+    """The F-curve driving key_block.value, or None."""
+    anim = key_block.id_data.animation_data
+    return anim.drivers.find(key_block.path_from_id("value")) if anim else None
+
+
+def is_shape_link_driver(fcurve, src_key, shape_name):
+    """True when fcurve is exactly the SUM driver reading shape_name on src_key."""
+    drv = fcurve.driver
+    if drv.type != 'SUM' or len(drv.variables) != 1:
+        return False
+    var = drv.variables[0]
+    target = var.targets[0]
+    return (
+        var.type == 'SINGLE_PROP' and target.id_type == 'KEY' and target.id == src_key
+        and target.data_path == shape_value_path(shape_name)
+    )
+
+
+def _link_shape_driver(key_block, src_key, shape_name, fcurve):
+    if fcurve:
+        if is_shape_link_driver(fcurve, src_key, shape_name):
+            return 'UNCHANGED'
+        key_block.driver_remove("value")
+    drv = key_block.driver_add("value").driver
+    drv.type = 'SUM'
+    var = drv.variables.new()
+    var.name = "src_val"
+    var.type = 'SINGLE_PROP'
+    var.targets[0].id_type = 'KEY'
+    var.targets[0].id = src_key
+    var.targets[0].data_path = shape_value_path(shape_name)
+    return 'REPAIRED' if fcurve else 'CREATED'
+
+
+def add_shape_driver(key_block, src_obj, shape_name):
+    """Make key_block follow shape_name on src_obj through a SUM driver, keeping an
+    existing driver that already does. Returns 'UNCHANGED', 'CREATED' or 'REPAIRED'."""
+    return _link_shape_driver(key_block, src_obj.data.shape_keys, shape_name, find_value_driver(key_block))
+
+
+def relink_shape_drivers(src_obj, tar, counts):
+    """Diff tar's shape key drivers against src_obj's keys: create missing ones, repair
+    wrong ones and remove Driver-mesh drivers from keys the Driver no longer has
+    (e.g. after a rename). Results are tallied into counts, keyed like add_shape_driver."""
+    src_key = src_obj.data.shape_keys
+    src_names = set(src_key.key_blocks.keys()[1:])
+    tar_key = tar.data.shape_keys
+    anim = tar_key.animation_data
+    drivers = {fc.data_path: fc for fc in anim.drivers} if anim else {}
+    for i, t_kb in enumerate(tar_key.key_blocks):
+        fcurve = drivers.get(t_kb.path_from_id("value"))
+        if i and t_kb.name in src_names:
+            result = _link_shape_driver(t_kb, src_key, t_kb.name, fcurve)
+        elif fcurve and any(t.id in (src_key, src_obj) for v in fcurve.driver.variables for t in v.targets):
+            t_kb.driver_remove("value")
+            result = 'REMOVED'
+        else:
+            continue
+        counts[result] = counts.get(result, 0) + 1
+    return counts
+
+
+def get_armature_meshes(arm_obj):
+    """All mesh objects with an Armature modifier pointing at arm_obj."""
+    return [
+        o for o in bpy.data.objects
+        if o.type == 'MESH' and any(m.type == 'ARMATURE' and m.object == arm_obj for m in o.modifiers)
+    ]
+
+
+def build_bone_index(arm_obj):
+    """Return (bone_names, merge_targets) for an armature: the set of all bone names,
+    and for every non-deform bone the name of its nearest deforming ancestor
+    (None when no ancestor deforms)."""
+    merge_targets = {}
+    for bone in arm_obj.data.bones:
+        if bone.use_deform:
+            continue
+        parent = bone.parent
+        while parent and not parent.use_deform:
+            parent = parent.parent
+        merge_targets[bone.name] = parent.name if parent else None
+    return {b.name for b in arm_obj.data.bones}, merge_targets
+
+
+def selected_meshes(context):
+    """Selected mesh objects, falling back to the active object when nothing is selected."""
+    meshes = [o for o in context.selected_objects if o.type == 'MESH']
+    obj = context.active_object
+    if not meshes and obj and obj.type == 'MESH':
+        meshes.append(obj)
+    return meshes
+
+
+def selected_armatures(context):
+    """Selected armatures plus the armatures driving selected meshes, without duplicates."""
+    armatures = []
+    for o in context.selected_objects or [o for o in [context.active_object] if o]:
+        if o.type == 'ARMATURE':
+            arm = o
+        elif o.type == 'MESH':
+            arm = get_mesh_armature(o)
+        else:
+            continue
+        if arm and arm not in armatures:
+            armatures.append(arm)
+    return armatures
+
+
+def sync_all_active_indices(context, shape_name):
+    """Move the active-shape-key highlight on the Driver and all Target meshes."""
+    scene = context.scene
+    objs = [t.obj for t in scene.ak_targets if t.obj]
+    if scene.ak_driver_mesh:
+        objs.append(scene.ak_driver_mesh)
+    for o in objs:
+        if o and o.type == 'MESH' and o.data.shape_keys:
+            idx = o.data.shape_keys.key_blocks.find(shape_name)
+            if idx != -1:
+                o.active_shape_key_index = idx
+
+
+# Folder rules shared by full and incremental autosort
+_TEMPLATE_FOLDERS = {}
+for _folder, _template in list(ARKIT_DEFAULTS.items()) + list(VRM_DEFAULTS.items()):
+    for _s in _template:
+        _TEMPLATE_FOLDERS.setdefault(_s, _folder)
+
+PREFIX_FOLDERS = [("EXP_", "Expressions"), ("Corrective_", "Corrective"), ("Jiggle_", "Jiggle")]
+FOLDER_ORDER   = list(ARKIT_DEFAULTS) + list(VRM_DEFAULTS) + [f for _, f in PREFIX_FOLDERS]
+# ARKit folders (and Other) stay even when empty; the rest are removed
+PERSISTENT_FOLDERS = set(ARKIT_DEFAULTS)
+TRAILING_FOLDERS   = ["Corrective", "Jiggle", "Other"]
+
+# Persistent shape → folder index for the Driver mesh, kept current by incremental autosort
+_folder_index = {"owner": None, "shapes": {}, "folders": {}}
+
+
+def shape_folder(name):
+    """Folder a shape belongs in: its ARKit/VRM template folder, a prefix folder, or Other."""
+    folder = _TEMPLATE_FOLDERS.get(name)
+    if folder:
+        return folder
+    for prefix, folder in PREFIX_FOLDERS:
+        if name.startswith(prefix):
+            return folder
+    return "Other"
+
+
+def folder_shape_order(folder, members):
+    """Template order for ARKit/VRM folders, A–Z for prefix folders and Other."""
+    template = ARKIT_DEFAULTS.get(folder) or VRM_DEFAULTS.get(folder)
+    if template:
+        return [s for s in template if s in members]
+    return sorted(members)
+
+
+def _write_folder(scene, folder, names):
+    idx = scene.ak_groups.find(folder)
+    if not names and folder not in PERSISTENT_FOLDERS:
+        if idx != -1:
+            scene.ak_groups.remove(idx)
+        return
+    if idx == -1:
+        group = scene.ak_groups.add()
+        group.name = folder
+    else:
+        group = scene.ak_groups[idx]
+    group.shapes.clear()
+    for name in names:
+        group.shapes.add().name = name
+
+
+def invalidate_folder_index():
+    _folder_index.update(owner=None, shapes={}, folders={})
+
+
+@persistent
+def _folder_index_reset(_dummy):
+    invalidate_folder_index()
+    _folder_rows.update(key=None, groups={}, filtered={})
+
+
+def migrate_folder_csv(scene):
+    """Move folder membership saved by older versions (comma-joined shapes_csv)
+    into the shapes collection. Returns the number of folders converted."""
+    migrated = 0
+    for g in scene.ak_groups:
+        if not g.shapes_csv:
+            continue
+        if not len(g.shapes):
+            for name in g.shapes_csv.split(","):
+                if name:
+                    g.shapes.add().name = name
+        g.shapes_csv = ""
+        migrated += 1
+    return migrated
+
+
+@persistent
+def _migrate_folder_csv_on_load(_dummy):
+    for scene in bpy.data.scenes:
+        migrate_folder_csv(scene)
+
+
+def _migrate_folder_csv_deferred():
+    # bpy.data is restricted inside register(); run once the add-on has finished enabling
+    _migrate_folder_csv_on_load(None)
+    return None
+
+
+def autosort_shapes_logic(context, added=None, removed=None):
+    """Sort shapes into ARKit/VRM folders, Corrective_/Jiggle_ by prefix, then Other.
+    With no arguments every folder is rebuilt. Passing the shape names an operation
+    added and/or removed on the Driver only rewrites the folders those names touch."""
+    scene = context.scene
+    master = scene.ak_driver_mesh
+    if not master or not master.data.shape_keys:
+        return
+
+    kb = master.data.shape_keys.key_blocks
+    owner = master.data.shape_keys.session_uid
+    full = (added is None and removed is None) or _folder_index["owner"] != owner
+    shapes, folders = _folder_index["shapes"], _folder_index["folders"]
+
+    if full:
+        shapes  = {k.name: shape_folder(k.name) for k in kb if k.name != "Basis"}
+        folders = {}
+        for name, folder in shapes.items():
+            folders.setdefault(folder, set()).add(name)
+        touched = set(FOLDER_ORDER)
+        for g in scene.ak_groups:
+            g.shapes.clear()
+    else:
+        touched = set()
+        for name in removed or ():
+            folder = shapes.pop(name, None)
+            if folder:
+                folders[folder].discard(name)
+                touched.add(folder)
+        for name in added or ():
+            if name == "Basis" or name not in kb or name in shapes:
+                continue
+            folder = shape_folder(name)
+            shapes[name] = folder
+            folders.setdefault(folder, set()).add(name)
+            touched.add(folder)
+        if shapes.keys() != {k.name for k in kb if k.name != "Basis"}:
+            # Keys added, removed or renamed behind the index's back — fall back to a full rebuild
+            invalidate_folder_index()
+            autosort_shapes_logic(context)
+            return
+
+    for folder in sorted(touched, key=FOLDER_ORDER.index):
+        _write_folder(scene, folder, folder_shape_order(folder, folders.get(folder, ())))
+
+    for fname in TRAILING_FOLDERS:
+        idx = scene.ak_groups.find(fname)
+        if idx != -1:
+            scene.ak_groups.move(idx, len(scene.ak_groups) - 1)
+
+    _folder_index.update(owner=owner, shapes=shapes, folders=folders)
+    cache_folder_rows(scene)
+
+
+# Per-folder display rows for the Driver mesh, primed by autosort and validated in draw():
+# {"key": validity key, "groups": {folder: [(shape, key index, side)]}, "filtered": {...}}
+_folder_rows = {"key": None, "groups": {}, "filtered": {}}
+
+
+def _folder_rows_key(scene):
+    master = scene.ak_driver_mesh
+    if not master or not master.data.shape_keys:
+        return None
+    # Ordered key names: Sort Shape Keys / Canonical Order keep the count but move indices
+    return (
+        master.name,
+        tuple(master.data.shape_keys.key_blocks.keys()),
+        tuple((g.name, len(g.shapes)) for g in scene.ak_groups),
+    )
+
+
+def cache_folder_rows(scene):
+    """Precompute every folder's (shape name, key index, side) rows for the Driver mesh.
+    side is 'LEFT' / 'RIGHT' for split halves, None for shapes that can be split."""
+    key = _folder_rows_key(scene)
+    groups = {}
+    if key:
+        kb = scene.ak_driver_mesh.data.shape_keys.key_blocks
+        lookup = {k.name: i for i, k in enumerate(kb)}
+        for g in scene.ak_groups:
+            groups[g.name] = [
+                (n, lookup[n], 'LEFT' if n.endswith("Left") else 'RIGHT' if n.endswith("Right") else None)
+                for n in (ref.name for ref in g.shapes) if n in lookup
+            ]
+    _folder_rows.update(key=key, groups=groups, filtered={})
+
+
+def ensure_folder_rows(scene):
+    """Rebuild the row cache when the Driver's keys or the folders changed. Call once per draw."""
+    if _folder_rows["key"] != _folder_rows_key(scene):
+        cache_folder_rows(scene)
+
+
+def get_folder_rows(scene, group_name, text_filter=""):
+    """Cached rows of one folder, optionally narrowed to names containing text_filter.
+    Validate the cache with ensure_folder_rows() first."""
+    rows = _folder_rows["groups"].get(group_name, [])
+    if not text_filter:
+        return rows
+    cache_key = (group_name, text_filter)
+    filtered = _folder_rows["filtered"].get(cache_key)
+    if filtered is None:
+        needle = text_filter.lower()
+        filtered = [r for r in rows if needle in r[0].lower()]
+        _folder_rows["filtered"][cache_key] = filtered
+    return filtered
+
+
+# ==============================================================================
+#  SHAPE KEY ARRAYS  (bulk foreach_get / foreach_set helpers)
+# ==============================================================================
+
+# Vertices within this distance of the split plane belong to neither side (hard split)
+SPLIT_CENTER_EPSILON = 0.001
+
+SPLIT_AXIS_ITEMS = [
+    ('X',    "X",    "Split across the mesh's local X = 0 plane"),
+    ('Y',    "Y",    "Split across the mesh's local Y = 0 plane"),
+    ('Z',    "Z",    "Split across the mesh's local Z = 0 plane"),
+    ('BONE', "Bone", "Split across the plane through a bone's head, facing the bone's X axis"),
+]
+
+
+def read_shape_coords(key_block):
+    """Return the key block's coordinates as a flat float32 array (x0, y0, z0, x1, ...)."""
+    coords = np.empty(len(key_block.data) * 3, dtype=np.float32)
+    key_block.data.foreach_get("co", coords)
+    return coords
+
+
+def write_shape_coords(key_block, coords):
+    """Write a flat float32 coordinate array back into the key block in one call."""
+    key_block.data.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32))
+
+
+def read_deform_weights(mesh):
+    """Return (vertex_indices, group_indices, weights) arrays for every deform weight
+    on mesh, read from the bmesh deform layer in one pass instead of through
+    per-vertex RNA group collections."""
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        deform = bm.verts.layers.deform.active
+        rows = [(v.index, g, w) for v in bm.verts for g, w in v[deform].items()] if deform else []
+    finally:
+        bm.free()
+    if not rows:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    table = np.array(rows, dtype=np.float64)
+    return table[:, 0].astype(np.int32), table[:, 1].astype(np.int32), table[:, 2].astype(np.float32)
+
+
+def read_vertex_group_weights(obj, group_name):
+    """Return the weights of group_name as a float32 array (0 where unassigned),
+    or None when the mesh has no such group.
+    Blender has no foreach_get access to deform weights, so this is one walk over the
+    vertices; read it once per mesh and share it across every key being split, as
+    split_shape_keys does."""
+    vg = obj.vertex_groups.get(group_name)
+    if vg is None:
+        return None
+    # Only this group's weight per vertex, not every deform weight of every group
+    index = vg.index
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        deform = bm.verts.layers.deform.active
+        if deform is None:
+            return np.zeros(len(bm.verts), dtype=np.float32)
+        return np.fromiter(
+            (v[deform].get(index, 0.0) for v in bm.verts), dtype=np.float32, count=len(bm.verts),
+        )
+    finally:
+        bm.free()
+
+
+def vertex_group_max_weights(obj):
+    """Return a float32 array with the highest weight each of obj's vertex groups
+    reaches on any vertex (0 for groups nothing is weighted to)."""
+    verts, groups, weights = read_deform_weights(obj.data)
+    result = np.zeros(len(obj.vertex_groups), dtype=np.float32)
+    valid = groups < len(result)
+    np.maximum.at(result, groups[valid], weights[valid])
+    return result
+
+
+# Merged weights are written rounded to this step, so a group needs at most 1024 add() calls
+WEIGHT_QUANTUM = 1.0 / 1024
+
+
+def merge_vertex_groups(obj, merges):
+    """Add the weights of each source group into its target group (clamped to 1).
+    merges maps source group name → target group name; missing targets are created.
+    Source groups are left in place for the caller to remove.
+    Returns the number of VertexGroup.add() calls made."""
+    verts, groups, weights = read_deform_weights(obj.data)
+    count = len(obj.data.vertices)
+    merged = {}
+    for source, target in merges.items():
+        src_vg = obj.vertex_groups.get(source)
+        if src_vg is None:
+            continue
+        if target not in merged:
+            tgt_vg = obj.vertex_groups.get(target)
+            merged[target] = np.zeros(count, dtype=np.float32)
+            if tgt_vg is not None:
+                in_tgt = groups == tgt_vg.index
+                merged[target][verts[in_tgt]] = weights[in_tgt]
+        in_src = groups == src_vg.index
+        np.add.at(merged[target], verts[in_src], weights[in_src])
+
+    add_calls = 0
+    for target, target_weights in merged.items():
+        tgt_vg = obj.vertex_groups.get(target) or obj.vertex_groups.new(name=target)
+        np.minimum(target_weights, 1.0, out=target_weights)
+        # add() takes one weight for many vertices: quantize so painted (all distinct)
+        # weights share at most 1024 values, then group the vertex indices in one sort.
+        # Tiny weights round up to one step instead of vanishing
+        nonzero = np.flatnonzero(target_weights)
+        steps = np.maximum(np.round(target_weights[nonzero] / WEIGHT_QUANTUM), 1)
+        values, inverse, counts = np.unique(steps, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind="stable")
+        for value, indices in zip(values, np.split(nonzero[order], np.cumsum(counts)[:-1])):
+            tgt_vg.add(indices.tolist(), float(value * WEIGHT_QUANTUM), 'REPLACE')
+        add_calls += len(values)
+    return add_calls
+
+
+def split_side_distance(obj, basis_co, axis='X', bone_name=""):
+    """Signed float64 distance of every Basis vertex from the split plane; positive
+    is the Right side. Returns None when axis is 'BONE' and the bone can't be found."""
+    basis = basis_co.reshape(-1, 3)
+    if axis != 'BONE':
+        # float64 so the threshold matches the old per-vertex Python test exactly
+        return basis[:, "XYZ".index(axis)].astype(np.float64)
+    arm_obj = get_mesh_armature(obj)
+    bone = arm_obj.data.bones.get(bone_name) if arm_obj else None
+    if not bone:
+        return None
+    to_local = obj.matrix_world.inverted() @ arm_obj.matrix_world @ bone.matrix_local
+    origin = np.array(to_local.translation, dtype=np.float64)
+    normal = np.array((to_local.to_3x3() @ Vector((1.0, 0.0, 0.0))).normalized(), dtype=np.float64)
+    return (basis.astype(np.float64) - origin) @ normal
+
+
+def split_side_weights(side, blend_width=0.0, mask=None, epsilon=SPLIT_CENTER_EPSILON):
+    """Return float32 (left_w, right_w) per-vertex weights for a split.
+    A blend_width of 0 gives the hard step; otherwise the sides cross-fade with a
+    smoothstep over blend_width centred on the plane. mask scales both sides."""
+    if blend_width <= 0.0:
+        left_w  = (side < -epsilon).astype(np.float32)
+        right_w = (side >  epsilon).astype(np.float32)
+    else:
+        t = np.clip(side / blend_width + 0.5, 0.0, 1.0)
+        right_w = (t * t * (3.0 - 2.0 * t)).astype(np.float32)
+        left_w  = 1.0 - right_w
+    if mask is not None:
+        left_w  *= mask
+        right_w *= mask
+    return left_w, right_w
+
+
+def apply_split_weights(basis_co, shape_co, weights):
+    """Blend from Basis towards the shape by per-vertex weight, as a flat array."""
+    basis = basis_co.reshape(-1, 3)
+    shape = shape_co.reshape(-1, 3)
+    out = basis + (shape - basis) * weights[:, None]
+    # Fully weighted vertices copy the shape exactly instead of basis + delta
+    return np.where((weights == 1.0)[:, None], shape, out).ravel()
+
+
+def split_left_right(basis_co, shape_co, epsilon=SPLIT_CENTER_EPSILON):
+    """Hard-split a shape into (left_co, right_co) flat arrays on the Basis X position.
+    Vertices with X > epsilon keep the shape offset on the Right key, X < -epsilon on
+    the Left key; everything else stays at Basis on both."""
+    side = basis_co.reshape(-1, 3)[:, 0].astype(np.float64)
+    left_w, right_w = split_side_weights(side, epsilon=epsilon)
+    return apply_split_weights(basis_co, shape_co, left_w), apply_split_weights(basis_co, shape_co, right_w)
+
+
+def split_settings(scene):
+    """Keyword arguments for split_shape_key taken from the scene's split settings."""
+    return {
+        "axis":         scene.ak_split_axis,
+        "blend_width":  scene.ak_split_blend_width,
+        "bone_name":    scene.ak_split_bone,
+        "vertex_group": scene.ak_split_vertex_group,
+    }
+
+
+def split_shape_keys(obj, splits, axis='X', blend_width=0.0, bone_name="", vertex_group=""):
+    """Split several shapes on obj in one pass. splits is an iterable of
+    (shape_name, left_name, right_name); Basis, the side weights and the mask are
+    read once and shared by every shape. Returns the shape names that were split."""
+    kb = obj.data.shape_keys.key_blocks
+    basis = kb.get("Basis")
+    splits = [s for s in splits if s[0] in kb]
+    if not basis or not splits:
+        return []
+    basis_co = read_shape_coords(basis)
+    side = split_side_distance(obj, basis_co, axis, bone_name)
+    if side is None:
+        return []
+    mask = read_vertex_group_weights(obj, vertex_group) if vertex_group else None
+    left_w, right_w = split_side_weights(side, blend_width, mask)
+
+    for shape_name, left_name, right_name in splits:
+        shape_co = read_shape_coords(kb[shape_name])
+        for n, weights in ((left_name, left_w), (right_name, right_w)):
+            if n in kb:
+                obj.shape_key_remove(kb[n])
+            write_shape_coords(obj.shape_key_add(name=n, from_mix=False),
+                               apply_split_weights(basis_co, shape_co, weights))
+    obj.data.update()
+    return [s[0] for s in splits]
+
+
+def split_shape_key(obj, shape_name, left_name, right_name, **settings):
+    """Replace left_name / right_name on obj with the halves of shape_name.
+    Returns False when the mesh has no Basis, no such shape, or the split bone is missing."""
+    return bool(split_shape_keys(obj, [(shape_name, left_name, right_name)], **settings))
+
+
+# ==============================================================================
+#  SHAPE KEY DELTA STATS  (cached per mesh + shape key)
+# ==============================================================================
+
+# Vertices that move less than this from Basis don't count as affected
+DELTA_EPSILON = 0.0001
+
+ShapeDeltaStats = namedtuple(
+    "ShapeDeltaStats", "max_displacement affected_count bbox_min bbox_max side"
+)
+
+# {mesh session_uid: {shape name: (shape checksum, basis checksum, ShapeDeltaStats)}}
+_delta_stats_cache = {}
+
+
+def coords_checksum(coords):
+    """Cheap checksum of a coordinate buffer, used to tell when cached stats are stale."""
+    return zlib.crc32(coords)
+
+
+def compute_delta_stats(basis_co, shape_co, epsilon=DELTA_EPSILON):
+    """Return ShapeDeltaStats for one shape against Basis. Side is 'LEFT' / 'RIGHT'
+    when only one side of X = 0 moves, 'CENTER' when both or only the middle moves,
+    and 'NONE' when nothing moves."""
+    basis = basis_co.reshape(-1, 3)
+    delta = (shape_co - basis_co).reshape(-1, 3).astype(np.float64)
+    dist  = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+    affected = dist > epsilon
+    count = int(np.count_nonzero(affected))
+    if not count:
+        return ShapeDeltaStats(float(dist.max()) if len(dist) else 0.0, 0, None, None, 'NONE')
+    moved = basis[affected]
+    x = moved[:, 0].astype(np.float64)
+    has_left  = bool((x < -SPLIT_CENTER_EPSILON).any())
+    has_right = bool((x >  SPLIT_CENTER_EPSILON).any())
+    side = 'LEFT' if has_left and not has_right else 'RIGHT' if has_right and not has_left else 'CENTER'
+    return ShapeDeltaStats(
+        float(dist.max()), count,
+        tuple(map(float, moved.min(axis=0))), tuple(map(float, moved.max(axis=0))), side,
+    )
+
+
+def get_mesh_delta_stats(mesh):
+    """Return {shape name: ShapeDeltaStats} for every non-Basis key on mesh.
+    Each key is fetched once and its stats are only recomputed when its checksum
+    (or the Basis checksum) changed since the last call."""
+    if not mesh.shape_keys:
+        return {}
+    kb = mesh.shape_keys.key_blocks
+    basis = kb.get("Basis")
+    if not basis:
+        return {}
+    basis_co  = read_shape_coords(basis)
+    basis_sum = coords_checksum(basis_co)
+    cached = _delta_stats_cache.get(mesh.session_uid, {})
+    fresh  = {}
+    for key in kb:
+        if key.name == "Basis":
+            continue
+        shape_co  = read_shape_coords(key)
+        shape_sum = coords_checksum(shape_co)
+        entry = cached.get(key.name)
+        if not entry or entry[0] != shape_sum or entry[1] != basis_sum:
+            entry = (shape_sum, basis_sum, compute_delta_stats(basis_co, shape_co))
+        fresh[key.name] = entry
+    # Replacing the mesh's entry also drops stats of deleted / renamed keys
+    _delta_stats_cache[mesh.session_uid] = fresh
+    return {name: entry[2] for name, entry in fresh.items()}
+
+
+def peek_mesh_delta_stats(mesh):
+    """Return the last computed stats for mesh without touching vertex data (for draw())."""
+    return {name: entry[2] for name, entry in _delta_stats_cache.get(mesh.session_uid, {}).items()}
+
+
+@persistent
+def _clear_delta_stats_on_load(_dummy):
+    _delta_stats_cache.clear()
+
+
+# ==============================================================================
+#  SPARSE SHAPE DELTAS  (indices + offsets, .npz exchange files)
+# ==============================================================================
+
+SHAPE_DELTA_FILE_VERSION = 1
+
+
+def extract_sparse_delta(basis_co, shape_co, epsilon=DELTA_EPSILON):
+    """Return (indices, deltas) for the vertices that move more than epsilon from
+    Basis: an int32 index array and a float32 (n, 3) offset array."""
+    delta = (shape_co - basis_co).reshape(-1, 3)
+    dist_sq = np.einsum("ij,ij->i", delta.astype(np.float64), delta.astype(np.float64))
+    indices = np.flatnonzero(dist_sq > epsilon * epsilon).astype(np.int32)
+    return indices, delta[indices]
+
+
+def apply_sparse_delta(basis_co, indices, deltas):
+    """Rebuild a flat shape coordinate array from Basis and a sparse delta."""
+    coords = basis_co.reshape(-1, 3).copy()
+    coords[indices] += deltas
+    return coords.ravel()
+
+
+def save_shape_deltas(filepath, mesh, names, epsilon=DELTA_EPSILON):
+    """Write the named shape keys of mesh as sparse deltas to a compressed .npz file.
+    Returns the names that were written."""
+    kb = mesh.shape_keys.key_blocks
+    basis = mesh.shape_keys.reference_key
+    basis_co = read_shape_coords(basis)
+    names = [n for n in names if n != basis.name and n in kb]
+    arrays = {
+        "version":      np.array(SHAPE_DELTA_FILE_VERSION),
+        "vertex_count": np.array(len(basis_co) // 3),
+        "names":        np.array(names, dtype=str),
+    }
+    for i, name in enumerate(names):
+        arrays[f"indices_{i}"], arrays[f"deltas_{i}"] = extract_sparse_delta(
+            basis_co, read_shape_coords(kb[name]), epsilon
+        )
+    np.savez_compressed(filepath, **arrays)
+    return names
+
+
+def invalid_shape_deltas(shapes, vertex_count):
+    """Names of entries in a loaded delta file that can't be applied to a mesh with
+    vertex_count vertices: non-integer or out-of-range indices, or deltas that aren't
+    float (len(indices), 3)."""
+    bad = []
+    for name, (indices, deltas) in shapes.items():
+        if (indices.ndim != 1 or not np.issubdtype(indices.dtype, np.integer)
+                or not np.issubdtype(deltas.dtype, np.floating)
+                or deltas.shape != (len(indices), 3)
+                or (indices.size and (indices.min() < 0 or indices.max() >= vertex_count))):
+            bad.append(name)
+    return bad
+
+
+def load_shape_deltas(filepath):
+    """Read a shape delta file. Returns (vertex_count, {name: (indices, deltas)})."""
+    with np.load(filepath, allow_pickle=False) as data:
+        if int(data["version"]) > SHAPE_DELTA_FILE_VERSION:
+            raise ValueError("Shape delta file was written by a newer version of the add-on")
+        shapes = {
+            str(name): (data[f"indices_{i}"], data[f"deltas_{i}"])
+            for i, name in enumerate(data["names"])
+        }
+        return int(data["vertex_count"]), shapes
+
+
+# ==============================================================================
+#  LINKED SHAPE VALUES  (bulk Driver → Target value sync, alternative to drivers)
+# ==============================================================================
+
+LINK_MODE_ITEMS = [
+    ('DRIVERS', "Drivers",   "One SUM driver per Target shape key"),
+    ('SYNC',    "Bulk Sync", "Copy every Driver key value to all Targets in one vectorized write per mesh on frame change and edits"),
+]
+
+# {"key": validity key, "pairs": [(target Key, src indices, dst indices)]}
+_link_sync_plan = {"key": None, "pairs": []}
+
+
+def _link_sync_key(scene):
+    # Ordered key names, not just counts: sorting or renaming keys keeps the count
+    # but moves names to other indices, which would make the plan write wrong keys
+    src = scene.ak_driver_mesh
+    if not src or not src.data.shape_keys:
+        return None
+    keys = [t.obj.data.shape_keys for t in scene.ak_targets
+            if t.obj and t.obj != src and t.obj.type == 'MESH' and t.obj.data.shape_keys]
+    # key_blocks.keys() builds the name lists in C; the key is only compared, never hashed
+    return (
+        src.data.shape_keys.session_uid, src.data.shape_keys.key_blocks.keys(),
+        [(k.session_uid, k.key_blocks.keys()) for k in keys],
+    )
+
+
+def build_link_sync_plan(scene):
+    """Match Target keys to Driver keys by name once; returns [(Key, src_idx, dst_idx)]."""
+    key = _link_sync_key(scene)
+    pairs = []
+    if key:
+        src_kb = scene.ak_driver_mesh.data.shape_keys.key_blocks
+        src_lookup = {k.name: i for i, k in enumerate(src_kb) if i > 0}
+        for t in scene.ak_targets:
+            tar = t.obj
+            if not tar or tar == scene.ak_driver_mesh or tar.type != 'MESH' or not tar.data.shape_keys:
+                continue
+            matched = [(src_lookup[k.name], i) for i, k in enumerate(tar.data.shape_keys.key_blocks)
+                       if k.name in src_lookup]
+            if matched:
+                src_idx, dst_idx = np.array(matched, dtype=np.int64).T
+                pairs.append((tar.data.shape_keys, src_idx, dst_idx))
+    _link_sync_plan.update(key=key, pairs=pairs)
+    return pairs
+
+
+def sync_linked_shape_values(scene):
+    """Copy Driver key values onto every Target in one foreach_set per mesh.
+    Only meshes whose values actually changed are written and tagged for update.
+    Returns the number of Target meshes written."""
+    if _link_sync_plan["key"] != _link_sync_key(scene):
+        build_link_sync_plan(scene)
+    pairs = _link_sync_plan["pairs"]
+    if not pairs:
+        return 0
+    src_kb = scene.ak_driver_mesh.data.shape_keys.key_blocks
+    src_vals = np.empty(len(src_kb), dtype=np.float32)
+    src_kb.foreach_get("value", src_vals)
+    written = 0
+    for shape_keys, src_idx, dst_idx in pairs:
+        t_kb = shape_keys.key_blocks
+        vals = np.empty(len(t_kb), dtype=np.float32)
+        t_kb.foreach_get("value", vals)
+        new = src_vals[src_idx]
+        if np.array_equal(vals[dst_idx], new):
+            continue
+        vals[dst_idx] = new
+        t_kb.foreach_set("value", vals)
+        shape_keys.update_tag()
+        written += 1
+    return written
+
+
+def invalidate_link_sync_plan():
+    _link_sync_plan.update(key=None, pairs=[])
+
+
+@persistent
+def _link_sync_update(scene, _depsgraph=None):
+    # Our own write tags the Target keys and fires this again; the changed-values
+    # check in sync_linked_shape_values makes that second pass a no-op
+    if scene.ak_link_sync:
+        sync_linked_shape_values(scene)
+
+
+@persistent
+def _link_sync_reset(_dummy):
+    invalidate_link_sync_plan()
+
+
+# ==============================================================================
+#  SHAPE KEY VALUES  (bulk value writes + scene-stored pose snapshots)
+# ==============================================================================
+
+RESET_MODE_ITEMS = [
+    ('ZERO',     "Zero",        "Set every shape key value to 0"),
+    ('SNAPSHOT', "Stored Pose", "Restore the values saved with Store Pose"),
+]
+
+# Scene ID property: {pose name: {mesh name: {"names": "\n"-joined keys, "values": [float]}}}
+POSE_SNAPSHOTS_PROP = "ak_pose_snapshots"
+RESET_POSE_NAME     = "Reset"
+
+# Stored values aligned to a mesh's current key blocks, keyed by (pose, mesh, Key uid, key count)
+_pose_values_cache = {}
+# Dynamic enum items must outlive the callback that returns them
+_pose_enum_items = []
+
+
+def read_shape_values(shape_keys):
+    """Every key block's value as a float32 array, in key block order."""
+    values = np.empty(len(shape_keys.key_blocks), dtype=np.float32)
+    shape_keys.key_blocks.foreach_get("value", values)
+    return values
+
+
+def driven_key_mask(shape_keys):
+    """Bool array marking key blocks whose value has an unmuted driver."""
+    kb = shape_keys.key_blocks
+    mask = np.zeros(len(kb), dtype=bool)
+    anim = shape_keys.animation_data
+    if anim and anim.drivers:
+        paths = {k.path_from_id("value"): i for i, k in enumerate(kb)}
+        for fc in anim.drivers:
+            i = paths.get(fc.data_path)
+            if i is not None and not fc.mute:
+                mask[i] = True
+    return mask
+
+
+def apply_shape_values(shape_keys, values, skip_driven=True):
+    """Write one value per key block with a single foreach_set. The reference key,
+    NaN entries and (with skip_driven) driven keys keep their current value.
+    Returns the number of keys whose value changed."""
+    current = read_shape_values(shape_keys)
+    keep = driven_key_mask(shape_keys) if skip_driven else np.zeros(len(current), dtype=bool)
+    keep[0] = True
+    keep |= np.isnan(values)
+    new = np.where(keep, current, values).astype(np.float32)
+    changed = int(np.count_nonzero(new != current))
+    if changed:
+        shape_keys.key_blocks.foreach_set("value", new)
+        shape_keys.update_tag()
+    return changed
+
+
+def add_shape_keys(objs, names, zero=False):
+    """Add every name a mesh in objs is missing, in one pass per mesh: existing keys
+    are checked against a single set and a Basis is created first where needed.
+    zero also sets the values of the named keys that already existed to 0 in one write.
+    Returns (created, skipped)."""
+    created = skipped = 0
+    for obj in dict.fromkeys(objs):
+        if obj.type != 'MESH':
+            continue
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+        existing = set(obj.data.shape_keys.key_blocks.keys())
+        missing = [n for n in dict.fromkeys(names) if n not in existing]
+        for name in missing:
+            obj.shape_key_add(name=name, from_mix=False)
+        created += len(missing)
+        skipped += len(set(names)) - len(missing)
+        if zero:
+            shape_keys = obj.data.shape_keys
+            wanted = set(names)
+            values = np.array(
+                [0.0 if n in wanted else np.nan for n in shape_keys.key_blocks.keys()], dtype=np.float32,
+            )
+            apply_shape_values(shape_keys, values, skip_driven=False)
+    return created, skipped
+
+
+def store_pose_snapshot(scene, objs, pose_name=RESET_POSE_NAME):
+    """Save the current shape key values of objs on the scene under pose_name.
+    Returns the number of meshes stored."""
+    if POSE_SNAPSHOTS_PROP not in scene:
+        scene[POSE_SNAPSHOTS_PROP] = {}
+    pose = {}
+    for obj in objs:
+        if obj.type != 'MESH' or not obj.data.shape_keys:
+            continue
+        shape_keys = obj.data.shape_keys
+        pose[obj.name] = {
+            "names":  "\n".join(shape_keys.key_blocks.keys()),
+            "values": read_shape_values(shape_keys).tolist(),
+        }
+    scene[POSE_SNAPSHOTS_PROP][pose_name] = pose
+    _pose_values_cache.clear()
+    return len(pose)
+
+
+def delete_pose_snapshot(scene, pose_name):
+    """Remove pose_name from the scene. Returns True when it existed."""
+    poses = scene.get(POSE_SNAPSHOTS_PROP)
+    if poses is None or pose_name not in poses:
+        return False
+    del poses[pose_name]
+    _pose_values_cache.clear()
+    return True
+
+
+def pose_snapshot_names(scene):
+    return list(scene.get(POSE_SNAPSHOTS_PROP, {}).keys())
+
+
+def pose_snapshot_values(scene, pose_name, obj):
+    """obj's stored values for pose_name aligned to its current key blocks by name
+    (NaN for keys the pose doesn't know), or None when the pose has no entry for obj."""
+    shape_keys = obj.data.shape_keys
+    if not shape_keys:
+        return None
+    # Keyed on the current key names so a sort or rename realigns the stored values
+    names = tuple(shape_keys.key_blocks.keys())
+    cache_key = (pose_name, obj.name, shape_keys.session_uid, names)
+    if cache_key in _pose_values_cache:
+        return _pose_values_cache[cache_key]
+    entry = scene.get(POSE_SNAPSHOTS_PROP, {}).get(pose_name, {}).get(obj.name)
+    values = None
+    if entry is not None:
+        lookup = {n: i for i, n in enumerate(entry["names"].split("\n"))}
+        stored = np.array(entry["values"].to_list(), dtype=np.float32)
+        src = np.array([lookup.get(n, -1) for n in names], dtype=np.int64)
+        values = np.full(len(src), np.nan, dtype=np.float32)
+        values[src >= 0] = stored[src[src >= 0]]
+    _pose_values_cache[cache_key] = values
+    return values
+
+
+def blend_pose_snapshots(scene, objs, pose_a, pose_b, factor, skip_driven=True):
+    """Write the linear blend of two poses (0 = pose_a, 1 = pose_b) onto objs, one
+    foreach_set per mesh. A key only one pose knows takes that pose's value.
+    Returns (keys changed, meshes changed)."""
+    keys = meshes = 0
+    for obj in dict.fromkeys(objs):
+        if obj.type != 'MESH':
+            continue
+        a = pose_snapshot_values(scene, pose_a, obj)
+        b = pose_snapshot_values(scene, pose_b, obj)
+        if a is None and b is None:
+            continue
+        a = b if a is None else a
+        b = a if b is None else b
+        a, b = np.where(np.isnan(a), b, a), np.where(np.isnan(b), a, b)
+        changed = apply_shape_values(obj.data.shape_keys, a + (b - a) * factor, skip_driven)
+        keys += changed
+        meshes += bool(changed)
+    return keys, meshes
+
+
+def driver_and_target_meshes(scene):
+    """The ARKit H Driver mesh and all Target meshes, without duplicates."""
+    objs = [t.obj for t in scene.ak_targets if t.obj]
+    if scene.ak_driver_mesh:
+        objs.append(scene.ak_driver_mesh)
+    return list(dict.fromkeys(objs))
+
+
+def pose_snapshot_items(self, context):
+    names = pose_snapshot_names(context.scene)
+    _pose_enum_items[:] = [(n, n, f"Pose snapshot '{n}'") for n in names] or [('NONE', "No Snapshots", "")]
+    return _pose_enum_items
+
+
+def _update_pose_blend(self, context):
+    if self.ak_pose_blend_a == 'NONE' or self.ak_pose_blend_b == 'NONE':
+        return
+    blend_pose_snapshots(
+        self, driver_and_target_meshes(self),
+        self.ak_pose_blend_a, self.ak_pose_blend_b, self.ak_pose_blend,
+    )
+
+
+@persistent
+def _clear_pose_cache(_dummy):
+    _pose_values_cache.clear()
+
+
+def reset_shape_values(scene, objs, mode='ZERO', skip_driven=True, pose_name=RESET_POSE_NAME):
+    """Zero every mesh in objs, or restore pose_name on it, one foreach_set per mesh.
+    Returns (keys changed, meshes changed)."""
+    keys = meshes = 0
+    for obj in dict.fromkeys(objs):
+        if obj.type != 'MESH' or not obj.data.shape_keys:
+            continue
+        shape_keys = obj.data.shape_keys
+        if mode == 'SNAPSHOT':
+            values = pose_snapshot_values(scene, pose_name, obj)
+            if values is None:
+                continue
+        else:
+            values = np.zeros(len(shape_keys.key_blocks), dtype=np.float32)
+        changed = apply_shape_values(shape_keys, values, skip_driven)
+        keys += changed
+        meshes += bool(changed)
+    return keys, meshes
+
+
+# ==============================================================================
+#  SHAPE KEY ORDER  (target permutation + minimal TOP/BOTTOM moves)
+# ==============================================================================
+
+SORT_MODE_ITEMS = [
+    ('ALPHA',   "A–Z",     "Alphabetical order"),
+    ('ARKIT',   "ARKit",   "ARKit canonical order, then the remaining keys A–Z"),
+    ('FOLDERS', "Folders", "Order of the ARKit H folders, then the remaining keys A–Z"),
+    ('CANONICAL', "ARKit/VRM", "ARKit then VRM default order, then EXP_, Corrective_ and Jiggle_ keys, then the rest"),
+]
+
+# Prefix groups that follow the ARKit / VRM defaults in canonical order
+CANONICAL_PREFIXES = ["EXP_", "Corrective_", "Jiggle_"]
+
+
+def shape_sort_order(names, mode='ALPHA', scene=None):
+    """Return names (excluding the reference key) in the target order for mode."""
+    if mode == 'ARKIT':
+        template = ARKIT_BLENDSHAPES
+    elif mode == 'CANONICAL':
+        template = ARKIT_BLENDSHAPES + [n for cat in VRM_DEFAULTS.values() for n in cat]
+        template += [n for prefix in CANONICAL_PREFIXES for n in sorted(names) if n.startswith(prefix)]
+    elif mode == 'FOLDERS' and scene is not None:
+        template = [ref.name for g in scene.ak_groups for ref in g.shapes]
+    else:
+        template = []
+    present = set(names)
+    ordered = list(dict.fromkeys(n for n in template if n in present))
+    placed = set(ordered)
+    return ordered + sorted(n for n in names if n not in placed)
+
+
+def plan_shape_key_moves(current, target):
+    """Return the (name, 'TOP' | 'BOTTOM') moves that turn current into target.
+    Both lists exclude the reference key. The longest run of target that already
+    sits in increasing order in current stays put; keys before it jump to TOP in
+    reverse order, keys after it jump to BOTTOM in order."""
+    pos = {name: i for i, name in enumerate(current)}
+    best_start = best_end = run_start = 0
+    for i in range(1, len(target) + 1):
+        if i == len(target) or pos[target[i]] < pos[target[i - 1]]:
+            if i - run_start > best_end - best_start:
+                best_start, best_end = run_start, i
+            run_start = i
+    moves = [(name, 'TOP') for name in reversed(target[:best_start])]
+    moves += [(name, 'BOTTOM') for name in target[best_end:]]
+    return moves
+
+
+def reorder_shape_keys(context, obj, target):
+    """Reorder obj's shape keys (reference key stays first) to match target.
+    Returns the number of shape_key_move calls that were needed."""
+    kb = obj.data.shape_keys.key_blocks
+    active_name = obj.active_shape_key.name if obj.active_shape_key else None
+    moves = plan_shape_key_moves([k.name for k in kb][1:], target)
+    with context.temp_override(object=obj, active_object=obj):
+        for name, direction in moves:
+            idx = kb.find(name)
+            # TOP on the key already at index 1 would make it the reference key
+            if direction == 'TOP' and idx == 1:
+                continue
+            obj.active_shape_key_index = idx
+            bpy.ops.object.shape_key_move(type=direction)
+    if active_name:
+        obj.active_shape_key_index = kb.find(active_name)
+    return len(moves)
+
+
+# ==============================================================================
+#  DATA MODELS  (Angelus)
+# ==============================================================================
+
+class AK_ShapeRef(PropertyGroup):
+    name: StringProperty(name="Shape")
+
+
+class AK_GroupItem(PropertyGroup):
+    name:       bpy.props.StringProperty(name="Group Name")
+    is_expanded: BoolProperty(name="Expanded", default=True)
+    shapes:     CollectionProperty(type=AK_ShapeRef)
+    # Comma-joined membership from older versions, moved into shapes on load
+    shapes_csv: StringProperty(name="Shapes (Legacy)", default="")
+    page:       IntProperty(name="Page", default=0, min=0)
+
+
+class AK_Target(PropertyGroup):
+    obj: PointerProperty(type=bpy.types.Object)
+
+
+# ==============================================================================
+#  OPERATORS — ANGELUS ARKIT HELPER  (prefix: AK_OT_)
+# ==============================================================================
+
+class AK_OT_select_shape_key(Operator):
+    bl_idname = "ak.select_shape_key"
+    bl_label  = "Select Blendshape"
+    bl_description = "Select this blendshape on the driver and all driven meshes"
+    shape_name: StringProperty()
+
+    def execute(self, context):
+        sync_all_active_indices(context, self.shape_name)
+        return {'FINISHED'}
+
+
+def add_template_shapes(op, context, names):
+    """Shared body of the Add ARKit / Add VRM batch operators."""
+    scene = context.scene
+    target = scene.ak_driver_mesh
+    if not target:
+        op.report({'WARNING'}, "Assign a Driver mesh first.")
+        return {'CANCELLED'}
+    objs = [target]
+    if op.include_targets:
+        objs += [t.obj for t in scene.ak_targets if t.obj]
+    start = time.perf_counter()
+    created, skipped = add_shape_keys(objs, names, zero=True)
+    autosort_shapes_logic(context, added=names)
+    op.report(
+        {'INFO'},
+        f"Created {created} shape keys, skipped {skipped} on {len(set(objs))} meshes "
+        f"in {time.perf_counter() - start:.2f}s",
+    )
+    return {'FINISHED'}
+
+
+class AK_OT_add_arkit_shapes(Operator):
+    bl_idname   = "ak.add_arkit_shapes"
+    bl_label    = "Add ARKit Shapes (Batch)"
+    bl_description = "Add all ARKit blendshapes to the Driver mesh"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    include_targets: BoolProperty(
+        name="Include Targets", description="Also add the shapes to every Target mesh", default=False,
+    )
+
+    def execute(self, context):
+        return add_template_shapes(self, context, [s for cat in ARKIT_DEFAULTS.values() for s in cat])
+
+
+class AK_OT_add_vrm_shapes(Operator):
+    bl_idname   = "ak.add_vrm_shapes"
+    bl_label    = "Add VRM Shapes (Batch)"
+    bl_description = "Add all VRM blendshapes (Emotions, Visemes, Blink, Look) to the Driver mesh"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    include_targets: BoolProperty(
+        name="Include Targets", description="Also add the shapes to every Target mesh", default=False,
+    )
+
+    def execute(self, context):
+        return add_template_shapes(self, context, [s for cat in VRM_DEFAULTS.values() for s in cat])
+
+
+class AK_OT_autosort_shapes(Operator):
+    bl_idname   = "ak.autosort_shapes"
+    bl_label    = "Autosort Shapes"
+    bl_description = "Sort shapes into ARKit/VRM folders, then extras to Other"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        autosort_shapes_logic(context)
+        return {'FINISHED'}
+
+
+class AK_OT_mirror_blendshape(Operator):
+    bl_idname   = "ak.mirror_blendshape"
+    bl_label    = "Split Left/Right"
+    bl_description = "Split the shape across the Split Settings plane on Driver and all Driven meshes"
+    bl_options  = {'REGISTER', 'UNDO'}
+    shape_name: StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        objs = [t.obj for t in scene.ak_targets if t.obj]
+        driver_obj = scene.ak_driver_mesh
+        if driver_obj:
+            objs.append(driver_obj)
+        if not objs:
+            return {'CANCELLED'}
+
+        left_name  = self.shape_name + "Left"
+        right_name = self.shape_name + "Right"
+
+        settings = split_settings(scene)
+        skipped = []
+        for obj in objs:
+            if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+                continue
+            if self.shape_name not in obj.data.shape_keys.key_blocks:
+                continue
+            if not split_shape_key(obj, self.shape_name, left_name, right_name, **settings):
+                skipped.append(obj.name)
+
+        if driver_obj and driver_obj.data.shape_keys:
+            for t in scene.ak_targets:
+                tar = t.obj
+                if not tar or not tar.data.shape_keys:
+                    continue
+                for n in (left_name, right_name):
+                    t_kb = tar.data.shape_keys.key_blocks.get(n)
+                    if t_kb:
+                        add_shape_driver(t_kb, driver_obj, n)
+
+        autosort_shapes_logic(context, added=(left_name, right_name))
+        if skipped:
+            self.report({'WARNING'}, f"Could not split on: {', '.join(skipped)} (missing Basis or split bone)")
+            return {'FINISHED'}
+        self.report({'INFO'}, f"Split '{self.shape_name}' → {left_name} / {right_name}")
+        return {'FINISHED'}
+
+
+class AK_OT_split_all_unmirrored(Operator):
+    bl_idname   = "ak.split_all_unmirrored"
+    bl_label    = "Split All Unmirrored"
+    bl_description = ("Split every unmirrored ARKit shape into Left/Right on Driver and all Driven meshes. "
+                      "Empty shapes and already sculpted Left/Right pairs are skipped unless Overwrite is on")
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    overwrite: BoolProperty(
+        name="Overwrite Sculpted Sides",
+        description="Replace Left/Right pairs that already hold a delta from Basis",
+        default=False,
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+    def execute(self, context):
+        scene = context.scene
+        driver_obj = scene.ak_driver_mesh
+        if not driver_obj or not driver_obj.data.shape_keys:
+            self.report({'WARNING'}, "Assign a Driver mesh with shapes first.")
+            return {'CANCELLED'}
+        objs = [t.obj for t in scene.ak_targets if t.obj and t.obj != driver_obj]
+        objs.append(driver_obj)
+
+        driver_kb = driver_obj.data.shape_keys.key_blocks
+        splits = [(s, s + "Left", s + "Right") for s in ARKIT_UNMIRRORED if s in driver_kb]
+        if not splits:
+            self.report({'INFO'}, "No unmirrored shapes to split.")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        settings = split_settings(scene)
+        split_names = {}
+        empty = sculpted = 0
+        for obj in objs:
+            if obj.type != 'MESH' or not obj.data.shape_keys:
+                continue
+            # Cached stats: an empty source would only write zeroed halves, and a pair
+            # with both sides moved is most likely sculpted by hand
+            stats = get_mesh_delta_stats(obj.data)
+            moved = {n for n, st in stats.items() if st.affected_count}
+            todo = []
+            for split in splits:
+                if split[0] in stats and split[0] not in moved:
+                    empty += 1
+                elif not self.overwrite and split[1] in moved and split[2] in moved:
+                    sculpted += 1
+                else:
+                    todo.append(split)
+            split_names[obj] = split_shape_keys(obj, todo, **settings)
+
+        for obj, names in split_names.items():
+            if obj == driver_obj:
+                continue
+            t_kb = obj.data.shape_keys.key_blocks
+            for name in names:
+                for n in (name + "Left", name + "Right"):
+                    add_shape_driver(t_kb[n], driver_obj, n)
+
+        driver_split = split_names.get(driver_obj, [])
+        autosort_shapes_logic(context, added=[n + side for n in driver_split for side in ("Left", "Right")])
+        meshes = sum(1 for names in split_names.values() if names)
+        shapes = sum(len(names) for names in split_names.values())
+        self.report(
+            {'INFO'},
+            f"Split {shapes} shapes on {meshes} meshes in {time.perf_counter() - start:.2f}s "
+            f"(skipped {empty} empty, {sculpted} already sculpted)",
+        )
+        return {'FINISHED'}
+
+
+class AK_OT_sort_rig_canonical(Operator):
+    bl_idname   = "ak.sort_rig_canonical"
+    bl_label    = "Canonical Order"
+    bl_description = ("Reorder shape keys on Driver and all Target meshes to ARKit, VRM, EXP_, "
+                      "Corrective_, Jiggle_, then the rest, so every mesh shares one key order")
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        objs = [t.obj for t in scene.ak_targets if t.obj]
+        if scene.ak_driver_mesh:
+            objs.append(scene.ak_driver_mesh)
+        objs = [o for o in dict.fromkeys(objs) if o.type == 'MESH' and o.data.shape_keys]
+        if not objs:
+            self.report({'WARNING'}, "Assign Driver/Target meshes with shapes first.")
+            return {'CANCELLED'}
+
+        moves = 0
+        for obj in objs:
+            names = [k.name for k in obj.data.shape_keys.key_blocks][1:]
+            moves += reorder_shape_keys(context, obj, shape_sort_order(names, 'CANONICAL'))
+        self.report({'INFO'}, f"Reordered {len(objs)} meshes with {moves} moves")
+        return {'FINISHED'}
+
+
+class AK_OT_select_all_meshes(Operator):
+    bl_idname   = "ak.select_all_meshes"
+    bl_label    = "Select All Rig Meshes"
+    bl_description = "Select the Driver and all Target meshes in the viewport"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.object.select_all(action='DESELECT')
+        scene = context.scene
+        objs = [t.obj for t in scene.ak_targets if t.obj]
+        if scene.ak_driver_mesh:
+            objs.append(scene.ak_driver_mesh)
+            context.view_layer.objects.active = scene.ak_driver_mesh
+        for o in objs:
+            o.select_set(True)
+        return {'FINISHED'}
+
+
+class AK_OT_create_drivers(Operator):
+    bl_idname   = "ak.create_drivers"
+    bl_label    = "Link Meshes"
+    bl_description = "Link secondary meshes to the Driver mesh blendshapes (drivers or bulk sync, see Link Mode)"
+
+    def execute(self, context):
+        scene = context.scene
+        src = scene.ak_driver_mesh
+        if not src or not src.data.shape_keys:
+            return {'CANCELLED'}
+        if scene.ak_link_mode == 'SYNC':
+            return self.link_sync(scene, src)
+        scene.ak_link_sync = False
+        start = time.perf_counter()
+        counts = {}
+        for item in scene.ak_targets:
+            tar = item.obj
+            if not tar or tar == src or tar.type != 'MESH':
+                continue
+            if not tar.data.shape_keys:
+                tar.shape_key_add(name="Basis")
+            relink_shape_drivers(src, tar, counts)
+        self.report(
+            {'INFO'},
+            f"Drivers: {counts.get('CREATED', 0)} created, {counts.get('REPAIRED', 0)} repaired, "
+            f"{counts.get('REMOVED', 0)} removed, {counts.get('UNCHANGED', 0)} unchanged "
+            f"in {(time.perf_counter() - start) * 1000:.0f} ms",
+        )
+        return {'FINISHED'}
+
+    def link_sync(self, scene, src):
+        # Drivers would override the synced values, so drop them on the linked keys
+        names = {k.name for k in src.data.shape_keys.key_blocks}
+        for item in scene.ak_targets:
+            tar = item.obj
+            if not tar or tar == src or not tar.data.shape_keys:
+                continue
+            for t_kb in tar.data.shape_keys.key_blocks:
+                if t_kb.name in names:
+                    t_kb.driver_remove("value")
+        scene.ak_link_sync = True
+        invalidate_link_sync_plan()
+        pairs = build_link_sync_plan(scene)
+        sync_linked_shape_values(scene)
+        linked = sum(len(dst) for _, _, dst in pairs)
+        self.report({'INFO'}, f"Bulk sync: {linked} shape keys on {len(pairs)} meshes follow the Driver")
+        return {'FINISHED'}
+
+
+class AK_OT_remove_drivers(Operator):
+    bl_idname   = "ak.remove_drivers"
+    bl_label    = "Unlink Meshes"
+    bl_description = "Remove driver setup and bulk sync from all Target mesh blendshapes"
+
+    def execute(self, context):
+        context.scene.ak_link_sync = False
+        for item in context.scene.ak_targets:
+            tar = item.obj
+            if not tar or not tar.data.shape_keys:
+                continue
+            for kb in tar.data.shape_keys.key_blocks:
+                kb.driver_remove("value")
+        return {'FINISHED'}
+
+
+class AK_OT_select_basis(Operator):
+    bl_idname   = "ak.select_basis"
+    bl_label    = "Select Basis"
+    bl_description = "Set the active shape key to Basis on all meshes"
+
+    def execute(self, context):
+        scene = context.scene
+        objs = [t.obj for t in scene.ak_targets if t.obj]
+        if scene.ak_driver_mesh:
+            objs.append(scene.ak_driver_mesh)
+        for o in objs:
+            if o.data.shape_keys:
+                o.active_shape_key_index = 0
+        return {'FINISHED'}
+
+
+class AK_OT_global_zero(Operator):
+    bl_idname   = "ak.global_zero"
+    bl_label    = "Zero Everything"
+    bl_description = "Set all blendshape values to 0 (or the stored pose) across Driver and all Target meshes, skipping driven keys"
+
+    mode: EnumProperty(name="Reset To", items=RESET_MODE_ITEMS, default='ZERO')
+    pose_name: StringProperty(name="Pose", default=RESET_POSE_NAME)
+
+    def execute(self, context):
+        scene = context.scene
+        objs = driver_and_target_meshes(scene)
+        keys, meshes = reset_shape_values(scene, objs, self.mode, pose_name=self.pose_name)
+        self.report({'INFO'}, f"Reset {keys} shape keys on {meshes} meshes")
+        return {'FINISHED'}
+
+
+class AK_OT_store_pose(Operator):
+    bl_idname   = "ak.store_pose"
+    bl_label    = "Store Pose"
+    bl_description = "Save the current blendshape values of the Driver and all Target meshes as a named pose snapshot"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    pose_name: StringProperty(name="Pose", default=RESET_POSE_NAME)
+
+    def execute(self, context):
+        scene = context.scene
+        if not self.pose_name or self.pose_name == 'NONE':
+            self.report({'WARNING'}, "Enter a pose name first.")
+            return {'CANCELLED'}
+        stored = store_pose_snapshot(scene, driver_and_target_meshes(scene), self.pose_name)
+        scene.ak_pose_active = self.pose_name
+        self.report({'INFO'}, f"Stored pose '{self.pose_name}' for {stored} meshes")
+        return {'FINISHED'}
+
+
+class AK_OT_delete_pose(Operator):
+    bl_idname   = "ak.delete_pose"
+    bl_label    = "Delete Pose"
+    bl_description = "Delete the selected pose snapshot"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    pose_name: StringProperty(name="Pose")
+
+    def execute(self, context):
+        if not delete_pose_snapshot(context.scene, self.pose_name):
+            self.report({'WARNING'}, f"No pose named '{self.pose_name}'.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Deleted pose '{self.pose_name}'")
+        return {'FINISHED'}
+
+
+class AK_OT_delete_all_shapes(Operator):
+    bl_idname   = "ak.delete_all_shapes"
+    bl_label    = "Delete All Shapes"
+    bl_description = "Delete ALL blendshapes on all meshes and clear folders. Cannot be undone easily."
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj = context.scene.ak_driver_mesh
+        if obj and obj.data.shape_keys:
+            obj.shape_key_clear()
+        for t in context.scene.ak_targets:
+            if t.obj and t.obj.data.shape_keys:
+                t.obj.shape_key_clear()
+        context.scene.ak_groups.clear()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+
+class AK_OT_target_add_selected(Operator):
+    bl_idname   = "ak.target_add_selected"
+    bl_label    = "Add Selected"
+    bl_description = "Add currently selected mesh(es) to the Target list"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        for o in context.selected_objects:
+            if o.type == 'MESH' and o != context.scene.ak_driver_mesh:
+                if not any(t.obj == o for t in context.scene.ak_targets):
+                    context.scene.ak_targets.add().obj = o
+        return {'FINISHED'}
+
+
+class AK_OT_target_remove(Operator):
+    bl_idname   = "ak.target_remove"
+    bl_label    = "Remove"
+    bl_description = "Remove the highlighted mesh from the Target list"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if context.scene.ak_target_index >= 0:
+            context.scene.ak_targets.remove(context.scene.ak_target_index)
+        return {'FINISHED'}
+
+
+class AK_OT_groups_toggle(Operator):
+    bl_idname = "ak.groups_toggle"
+    bl_label  = "Toggle All"
+
+    def execute(self, context):
+        state = not any(g.is_expanded for g in context.scene.ak_groups)
+        for g in context.scene.ak_groups:
+            g.is_expanded = state
+        return {'FINISHED'}
+
+
+class AK_OT_folder_page(Operator):
+    bl_idname = "ak.folder_page"
+    bl_label  = "Change Page"
+    bl_description = "Show the previous / next page of this folder"
+    group_name: StringProperty()
+    step: IntProperty(default=1)
+    pages: IntProperty(default=1, min=1)
+
+    def execute(self, context):
+        group = context.scene.ak_groups.get(self.group_name)
+        if group:
+            # Start from the page draw() shows, which may be past the end after rows went away
+            page = min(group.page, self.pages - 1)
+            group.page = max(0, min(page + self.step, self.pages - 1))
+        return {'FINISHED'}
+
+
+class AK_OT_delete_single_shape(Operator):
+    bl_idname   = "ak.delete_single_shape"
+    bl_label    = "Delete Blendshape?"
+    bl_description = "Delete this blendshape from all meshes"
+    bl_options  = {'REGISTER', 'UNDO'}
+    shape_name: StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        for t in scene.ak_targets:
+            tar = t.obj
+            if tar and tar.data.shape_keys:
+                kb = tar.data.shape_keys.key_blocks.get(self.shape_name)
+                if kb:
+                    kb.driver_remove("value")
+                    tar.shape_key_remove(kb)
+        master = scene.ak_driver_mesh
+        if master and master.data.shape_keys:
+            kb = master.data.shape_keys.key_blocks.get(self.shape_name)
+            if kb:
+                master.shape_key_remove(kb)
+        autosort_shapes_logic(context, removed=(self.shape_name,))
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+
+class AK_OT_add_single_arkit_shape(Operator):
+    bl_idname   = "ak.add_single_arkit_shape"
+    bl_label    = "Add Shapekey"
+    bl_description = "Add this shape key to all Target meshes and create drivers"
+    bl_options  = {'REGISTER', 'UNDO'}
+    shape_name: StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        src = scene.ak_driver_mesh
+        targets = [t.obj for t in scene.ak_targets if t.obj]
+        if not targets or not src or not src.data.shape_keys:
+            self.report({'WARNING'}, "Assign Driver/Target meshes first.")
+            return {'CANCELLED'}
+        counts = {}
+        for ob in targets:
+            if ob.type != 'MESH':
+                continue
+            if not ob.data.shape_keys:
+                ob.shape_key_add(name="Basis")
+            kb = ob.data.shape_keys.key_blocks
+            if self.shape_name not in kb:
+                ob.shape_key_add(name=self.shape_name)
+            kb[self.shape_name].value = 0.0
+            if ob == src:
+                continue
+            result = add_shape_driver(kb[self.shape_name], src, self.shape_name)
+            counts[result] = counts.get(result, 0) + 1
+        autosort_shapes_logic(context, added=(self.shape_name,))
+        self.report(
+            {'INFO'},
+            f"'{self.shape_name}': {counts.get('CREATED', 0)} drivers created, "
+            f"{counts.get('REPAIRED', 0)} repaired, {counts.get('UNCHANGED', 0)} unchanged",
+        )
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — VRM TOOLS  (prefix: PANKO_OT_)
+# ==============================================================================
+
+class PANKO_OT_CreateARKitBlendshapes(Operator):
+    """Create all 52 ARKit blendshapes on the selected meshes"""
+    bl_idname  = "panko.create_arkit_blendshapes"
+    bl_label   = "Create ARKit Blendshapes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(selected_meshes(context))
+
+    def execute(self, context):
+        meshes = selected_meshes(context)
+        start = time.perf_counter()
+        created, skipped = add_shape_keys(meshes, ARKIT_BLENDSHAPES)
+        self.report(
+            {'INFO'},
+            f"Created {created} ARKit blendshapes, skipped {skipped} on {len(meshes)} meshes "
+            f"in {time.perf_counter() - start:.2f}s",
+        )
+        return {'FINISHED'}
+
+
+class PANKO_OT_CreateARKitVRMBlendshapes(Operator):
+    """Create ARKit + VRM blendshapes on the selected meshes"""
+    bl_idname  = "panko.create_arkit_vrm_blendshapes"
+    bl_label   = "Create ARKit + VRM Blendshapes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(selected_meshes(context))
+
+    def execute(self, context):
+        meshes = selected_meshes(context)
+        start = time.perf_counter()
+        created, skipped = add_shape_keys(meshes, ARKIT_VRM_BLENDSHAPES)
+        self.report(
+            {'INFO'},
+            f"Created {created} blendshapes, skipped {skipped} on {len(meshes)} meshes "
+            f"in {time.perf_counter() - start:.2f}s",
+        )
+        return {'FINISHED'}
+
+
+def add_arkit_expressions(armature_obj, index, mesh_obj):
+    """Add a VRM custom expression, bound to mesh_obj, for every ARKit shape the mesh
+    has and the expressions lack. Returns (created, skipped)."""
+    shape_keys = mesh_obj.data.shape_keys.key_blocks
+    new_names  = [n for n in ARKIT_BLENDSHAPES if n in shape_keys and n not in index]
+    for name in new_names:
+        index.add_expression(name)
+    write_morph_target_binds(armature_obj, index, [(n, mesh_obj, n) for n in new_names])
+    return len(new_names), len(ARKIT_BLENDSHAPES) - len(new_names)
+
+
+def assign_arkit_binds(armature_obj, index, meshes, counts=None, shape_mesh=None):
+    """Bind every ARKit shape on meshes to the expression of the same name.
+    shape_mesh is an already built build_shape_mesh_index() map for meshes.
+    Returns (assigned, skipped) like write_morph_target_binds."""
+    if shape_mesh is None:
+        shape_mesh = build_shape_mesh_index(meshes, ARKIT_BLENDSHAPES)
+    binds = [(n, obj, n) for n in ARKIT_BLENDSHAPES for obj in shape_mesh.get(n, ())]
+    return write_morph_target_binds(armature_obj, index, binds, counts=counts)
+
+
+class PANKO_OT_AddARKitToVRMExpressions(Operator):
+    """Add all ARKit blendshapes as VRM 1.0 custom expressions"""
+    bl_idname  = "panko.add_arkit_to_vrm"
+    bl_label   = "Add ARKit to VRM Expressions"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        arm, _, _ = cached_vrm_armature_and_extension()
+        return arm is not None and vrm_scene_has_shape_meshes()
+
+    def execute(self, context):
+        armature, armature_obj, vrm_extension = get_vrm_armature_and_extension()
+        if not armature:
+            self.report({'ERROR'}, "VRM armature not found!")
+            return {'CANCELLED'}
+
+        mesh_obj = next(
+            (o for o in bpy.data.objects if o.type == 'MESH' and o.data.shape_keys), None
+        )
+        if not mesh_obj:
+            self.report({'ERROR'}, "No mesh with shape keys found!")
+            return {'CANCELLED'}
+
+        index = VRMExpressionIndex(vrm_extension.vrm1.expressions)
+        created, skipped = add_arkit_expressions(armature_obj, index, mesh_obj)
+        self.report({'INFO'}, f"Created {created} VRM expressions, skipped {skipped}")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AssignBlendshapesToProxies(Operator):
+    """Assign ARKit shape keys of every VRM mesh to their VRM custom expressions"""
+    bl_idname  = "panko.assign_blendshapes_proxies"
+    bl_label   = "Assign All Meshes to Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        arm, arm_obj, _ = cached_vrm_armature_and_extension()
+        return arm is not None and arm_obj is not None and vrm_scene_has_shape_meshes()
+
+    def execute(self, context):
+        armature, armature_obj, vrm_extension = get_vrm_armature_and_extension()
+        if not armature or not armature_obj:
+            self.report({'ERROR'}, "VRM armature not found!")
+            return {'CANCELLED'}
+
+        meshes = get_vrm_shape_meshes(armature_obj)
+        if not meshes:
+            self.report({'ERROR'}, "No mesh with shape keys found!")
+            return {'CANCELLED'}
+
+        index  = VRMExpressionIndex(vrm_extension.vrm1.expressions)
+        counts = {}
+
+        assigned, skipped = assign_arkit_binds(armature_obj, index, meshes, counts)
+        for obj in meshes:
+            if obj.name in counts:
+                self.report({'INFO'}, f"{obj.name}: {counts[obj.name]} binds")
+
+        self.report({'INFO'}, f"Assigned {assigned} binds on {len(counts)} meshes, skipped {skipped}")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AssignSelectedMeshBlendshapesToProxies(Operator):
+    """Assign ARKit shape keys from the active mesh to matching VRM expressions"""
+    bl_idname  = "panko.assign_selected_mesh_proxies"
+    bl_label   = "Assign Selected Mesh to Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        arm, arm_obj, _ = cached_vrm_armature_and_extension()
+        obj = context.active_object
+        return (arm is not None and arm_obj is not None
+                and obj is not None and obj.type == 'MESH'
+                and obj.data.shape_keys is not None)
+
+    def execute(self, context):
+        mesh_obj   = context.active_object
+        shape_keys = mesh_obj.data.shape_keys.key_blocks
+        armature, armature_obj, vrm_ext = get_vrm_armature_and_extension()
+        if not armature or not armature_obj:
+            self.report({'ERROR'}, "VRM armature not found!")
+            return {'CANCELLED'}
+
+        index = VRMExpressionIndex(vrm_ext.vrm1.expressions)
+        assigned, skipped = assign_arkit_binds(armature_obj, index, [mesh_obj])
+        skipped += sum(1 for n in ARKIT_BLENDSHAPES if n not in shape_keys)
+
+        self.report({'INFO'}, f"Assigned {assigned} from selected mesh, skipped {skipped}")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AddCustomBlendshape(Operator):
+    """Add a single custom blendshape to the active mesh"""
+    bl_idname  = "panko.add_custom_blendshape"
+    bl_label   = "Add Custom Blendshape"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shape_name: StringProperty(name="Shape Name", default="custom_expression")
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH'
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.layout.prop(self, "shape_name")
+
+    def execute(self, context):
+        obj = context.active_object
+        name = self.shape_name.strip()
+        if not name:
+            self.report({'ERROR'}, "Shape name cannot be empty!")
+            return {'CANCELLED'}
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+        if obj.data.shape_keys.key_blocks.get(name):
+            self.report({'WARNING'}, f"'{name}' already exists!")
+            return {'CANCELLED'}
+        obj.shape_key_add(name=name, from_mix=False)
+        self.report({'INFO'}, f"Created '{name}'")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AddMultipleCustomBlendshapes(Operator):
+    """Add multiple custom blendshapes at once (comma-separated)"""
+    bl_idname  = "panko.add_multiple_custom_blendshapes"
+    bl_label   = "Add Multiple Blendshapes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shape_names: StringProperty(name="Shape Names", default="")
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH'
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Comma-separated names:")
+        layout.prop(self, "shape_names", text="")
+        layout.label(text="e.g.  smirk, wink, pout", icon='INFO')
+
+    def execute(self, context):
+        obj = context.active_object
+        names = [n.strip() for n in self.shape_names.split(',') if n.strip()]
+        if not names:
+            self.report({'ERROR'}, "No valid names provided!")
+            return {'CANCELLED'}
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+        created = skipped = 0
+        for name in names:
+            if obj.data.shape_keys.key_blocks.get(name):
+                skipped += 1
+            else:
+                obj.shape_key_add(name=name, from_mix=False)
+                created += 1
+        self.report({'INFO'}, f"Created {created}, skipped {skipped}")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AddCustomBlendshapeToVRM(Operator):
+    """Add a custom blendshape to VRM expressions"""
+    bl_idname  = "panko.add_custom_blendshape_to_vrm"
+    bl_label   = "Add Custom Shape to VRM"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shape_name: StringProperty(name="Shape Key Name", default="")
+
+    @classmethod
+    def poll(cls, context):
+        arm, _, _ = cached_vrm_armature_and_extension()
+        obj = context.active_object
+        return (arm is not None and obj is not None
+                and obj.type == 'MESH' and obj.data.shape_keys is not None)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+        layout.label(text="Select shape key to add to VRM:")
+        if obj and obj.data.shape_keys:
+            layout.prop_search(self, "shape_name", obj.data.shape_keys, "key_blocks", text="Shape Key")
+        else:
+            layout.prop(self, "shape_name")
+
+    def execute(self, context):
+        name = self.shape_name.strip()
+        if not name:
+            self.report({'ERROR'}, "Shape name cannot be empty!")
+            return {'CANCELLED'}
+        mesh_obj = context.active_object
+        armature, armature_obj, vrm_extension = get_vrm_armature_and_extension()
+        if not armature or not armature_obj:
+            self.report({'ERROR'}, "VRM armature not found!")
+            return {'CANCELLED'}
+        index      = VRMExpressionIndex(vrm_extension.vrm1.expressions)
+        shape_keys = mesh_obj.data.shape_keys.key_blocks
+        if name not in shape_keys:
+            self.report({'ERROR'}, f"Shape key '{name}' not found!")
+            return {'CANCELLED'}
+        if name in index:
+            self.report({'WARNING'}, f"VRM expression '{name}' already exists!")
+            return {'CANCELLED'}
+        index.add_expression(name)
+        write_morph_target_binds(armature_obj, index, [(name, mesh_obj, name)])
+        self.report({'INFO'}, f"Added '{name}' to VRM expressions")
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — SHAPE DELTA FILES  (prefix: PANKO_OT_)
+# ==============================================================================
+
+class PANKO_OT_ExportShapeDeltas(Operator, ExportHelper):
+    """Export all shape keys of the active mesh as sparse deltas (.npz)"""
+    bl_idname   = "panko.export_shape_deltas"
+    bl_label    = "Export Shape Deltas"
+    bl_description = "Save every shape key as moved-vertex indices + offsets in a compact .npz file"
+    bl_options  = {'REGISTER'}
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    epsilon: FloatProperty(
+        name="Epsilon",
+        description="Vertices that move less than this from Basis are not stored",
+        default=DELTA_EPSILON,
+        min=0.0,
+        max=0.01,
+        precision=5,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj and obj.type == 'MESH'
+                and obj.data.shape_keys
+                and obj.data.shape_keys.reference_key is not None)
+
+    def execute(self, context):
+        mesh = context.active_object.data
+        names = save_shape_deltas(
+            self.filepath, mesh, [k.name for k in mesh.shape_keys.key_blocks], self.epsilon
+        )
+        self.report({'INFO'}, f"Exported {len(names)} shape deltas")
+        return {'FINISHED'}
+
+
+class PANKO_OT_ImportShapeDeltas(Operator, ImportHelper):
+    """Import sparse shape deltas (.npz) onto the active mesh"""
+    bl_idname   = "panko.import_shape_deltas"
+    bl_label    = "Import Shape Deltas"
+    bl_description = "Create shape keys from a shape delta file; the mesh must have the same vertex count"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    overwrite: BoolProperty(
+        name="Overwrite Existing",
+        description="Replace shape keys that already exist on the mesh",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object and context.active_object.type == 'MESH'
+
+    def execute(self, context):
+        obj = context.active_object
+        try:
+            vertex_count, shapes = load_shape_deltas(self.filepath)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            self.report({'ERROR'}, f"Could not read shape deltas: {e}")
+            return {'CANCELLED'}
+        if vertex_count != len(obj.data.vertices):
+            self.report(
+                {'ERROR'},
+                f"File is for {vertex_count} vertices, '{obj.name}' has {len(obj.data.vertices)}",
+            )
+            return {'CANCELLED'}
+        # Validate every entry before any key is created, so a bad file changes nothing
+        bad = invalid_shape_deltas(shapes, vertex_count)
+        if bad:
+            self.report({'ERROR'}, f"Invalid indices or deltas in: {', '.join(bad)}")
+            return {'CANCELLED'}
+
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+        kb = obj.data.shape_keys.key_blocks
+        basis_co = read_shape_coords(obj.data.shape_keys.reference_key)
+        created = skipped = 0
+        for name, (indices, deltas) in shapes.items():
+            key = kb.get(name)
+            if key and not self.overwrite:
+                skipped += 1
+                continue
+            if not key:
+                key = obj.shape_key_add(name=name, from_mix=False)
+            write_shape_coords(key, apply_sparse_delta(basis_co, indices, deltas))
+            created += 1
+        obj.data.update()
+        self.report({'INFO'}, f"Imported {created} shape deltas, skipped {skipped}")
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — MESH CLEANUP  (prefix: PANKO_OT_)
+# ==============================================================================
+
+def remove_empty_shape_keys(obj, threshold=0.0001):
+    """Remove obj's shape keys that move no vertex further than threshold from Basis.
+    Returns the removed (name, max displacement) pairs."""
+    kb = obj.data.shape_keys.key_blocks
+    to_remove = [
+        (name, stats.max_displacement)
+        for name, stats in get_mesh_delta_stats(obj.data).items()
+        if stats.max_displacement <= threshold
+    ]
+    for name, _ in to_remove:
+        key = kb.get(name)
+        if key:
+            obj.shape_key_remove(key)
+    return to_remove
+
+
+class PANKO_OT_RemoveEmptyBlendshapes(Operator):
+    """Remove shape keys with no vertex deformation from Basis on the active mesh"""
+    bl_idname   = "panko.remove_empty_blendshapes"
+    bl_label    = "Remove Empty Blendshapes"
+    bl_description = "Delete shape keys whose every vertex matches the Basis position"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Max vertex distance from Basis to be considered empty",
+        default=0.0001,
+        min=0.0,
+        max=0.01,
+        precision=5,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj and obj.type == 'MESH'
+                and obj.data.shape_keys
+                and len(obj.data.shape_keys.key_blocks) > 1)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.layout.prop(self, "threshold")
+
+    def execute(self, context):
+        obj   = context.active_object
+        kb    = obj.data.shape_keys.key_blocks
+        basis = kb.get("Basis")
+        if not basis:
+            self.report({'WARNING'}, "No Basis shape key found!")
+            return {'CANCELLED'}
+
+        to_remove = remove_empty_shape_keys(obj, self.threshold)
+        # Full list goes to the console; one report line keeps the info log readable
+        for name, displacement in to_remove:
+            print(f"Removed '{name}' from '{obj.name}' (max displacement {displacement:.6f})")
+
+        self.report({'INFO'}, f"Removed {len(to_remove)} empty blendshapes (list in the system console)"
+                    if to_remove else "Removed 0 empty blendshapes")
+        return {'FINISHED'}
+
+
+class PANKO_OT_AnalyzeShapeKeys(Operator):
+    """Compute displacement statistics for every shape key on the active mesh"""
+    bl_idname   = "panko.analyze_shape_keys"
+    bl_label    = "Analyze Shape Keys"
+    bl_description = "Refresh max displacement, affected vertices, bounds and side for every shape key"
+    bl_options  = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def execute(self, context):
+        obj = context.active_object
+        stats = get_mesh_delta_stats(obj.data)
+        if not stats:
+            self.report({'WARNING'}, "No Basis shape key found!")
+            return {'CANCELLED'}
+        empty = sum(1 for st in stats.values() if st.side == 'NONE')
+        self.report({'INFO'}, f"Analyzed {len(stats)} shape keys, {empty} empty")
+        return {'FINISHED'}
+
+
+def remove_empty_vertex_groups(obj, threshold=0.0):
+    """Remove obj's vertex groups whose weights never exceed threshold. Returns the count."""
+    if not obj.vertex_groups:
+        return 0
+    max_weights = vertex_group_max_weights(obj)
+    to_remove = [vg for vg in obj.vertex_groups if max_weights[vg.index] <= threshold]
+    for vg in to_remove:
+        obj.vertex_groups.remove(vg)
+    return len(to_remove)
+
+
+class PANKO_OT_RemoveEmptyVertexGroups(Operator):
+    """Remove vertex groups with no vertices assigned on the selected meshes"""
+    bl_idname   = "panko.remove_empty_vertex_groups"
+    bl_label    = "Remove Empty Vertex Groups"
+    bl_description = "Delete vertex groups that have no vertices weighted above the threshold on every selected mesh"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Groups whose weights never exceed this value count as empty",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        precision=3,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(o.type == 'MESH' and len(o.vertex_groups) > 0 for o in selected_meshes(context))
+
+    def execute(self, context):
+        total = 0
+        for obj in selected_meshes(context):
+            if not obj.vertex_groups:
+                continue
+            removed = remove_empty_vertex_groups(obj, self.threshold)
+            total += removed
+            self.report({'INFO'}, f"{obj.name}: removed {removed} empty vertex groups")
+
+        self.report({'INFO'}, f"Removed {total} empty vertex groups")
+        return {'FINISHED'}
+
+
+class PANKO_OT_RemoveUnassignedBoneVertexGroups(Operator):
+    """Remove vertex groups not linked to any bone in the armature modifier"""
+    bl_idname   = "panko.remove_unassigned_bone_vgroups"
+    bl_label    = "Remove Unassigned Bone VGroups"
+    bl_description = "Delete vertex groups whose name doesn't match any bone in the armature"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and len(obj.vertex_groups) > 0
+
+    def execute(self, context):
+        obj = context.active_object
+        armature = get_mesh_armature(obj)
+        if not armature:
+            self.report({'WARNING'}, "No armature modifier found on this mesh!")
+            return {'CANCELLED'}
+
+        bone_names = {b.name for b in armature.data.bones}
+        to_remove  = [vg for vg in obj.vertex_groups if vg.name not in bone_names]
+        for vg in to_remove:
+            obj.vertex_groups.remove(vg)
+
+        self.report({'INFO'}, f"Removed {len(to_remove)} vertex groups not linked to bones")
+        return {'FINISHED'}
+
+
+def cleanup_rig_vertex_groups(arm_obj, merge_non_deform=False):
+    """Remove boneless vertex groups on every mesh deformed by arm_obj, optionally
+    merging non-deform bone weights into their deforming parent first. Non-deform
+    groups with no deforming ancestor have nowhere to merge to and are kept.
+    Returns [(mesh, removed, merged, kept)]."""
+    bone_names, merge_targets = build_bone_index(arm_obj)
+    results = []
+    for obj in get_armature_meshes(arm_obj):
+        to_remove = [vg.name for vg in obj.vertex_groups if vg.name not in bone_names]
+        merged = kept = 0
+        if merge_non_deform:
+            non_deform = [vg.name for vg in obj.vertex_groups if vg.name in merge_targets]
+            merges = {n: merge_targets[n] for n in non_deform if merge_targets[n]}
+            if merges:
+                merge_vertex_groups(obj, merges)
+            merged = len(merges)
+            kept = len(non_deform) - merged
+            to_remove += merges
+        for name in to_remove:
+            obj.vertex_groups.remove(obj.vertex_groups[name])
+        results.append((obj, len(to_remove), merged, kept))
+    return results
+
+
+class PANKO_OT_CleanupRigVertexGroups(Operator):
+    """Remove vertex groups without a bone on every mesh bound to the selected armatures"""
+    bl_idname   = "panko.cleanup_rig_vertex_groups"
+    bl_label    = "Clean Up Rig VGroups"
+    bl_description = ("Remove vertex groups that match no bone on every mesh deformed by the selected "
+                      "armature(s), optionally merging non-deform bone weights into their parent")
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    merge_non_deform: BoolProperty(
+        name="Merge Non-Deform Bones",
+        description="Add weights of non-deform bone groups to the nearest deforming parent, then remove them",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return bool(selected_armatures(context))
+
+    def execute(self, context):
+        removed_total = merged_total = kept_total = meshes = 0
+        for arm_obj in selected_armatures(context):
+            for obj, removed, merged, kept in cleanup_rig_vertex_groups(arm_obj, self.merge_non_deform):
+                removed_total += removed
+                merged_total  += merged
+                kept_total    += kept
+                meshes += 1
+                msg = f"{obj.name}: removed {removed} groups ({merged} merged into parents)"
+                if kept:
+                    msg += f", kept {kept} non-deform groups with no deforming parent"
+                self.report({'INFO'}, msg)
+
+        msg = f"Removed {removed_total} groups ({merged_total} merged) on {meshes} meshes"
+        if kept_total:
+            msg += f", kept {kept_total} non-deform groups with no deforming parent"
+        self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — NAMING & SORTING  (prefix: PANKO_OT_)
+# ==============================================================================
+
+def rename_lr_suffixes(obj):
+    """Rename obj's _L / .L / _R / .R shape keys to ...Left / ...Right. Returns the count."""
+    renamed = 0
+    for key in obj.data.shape_keys.key_blocks:
+        for suffix, replacement in [("_L", "Left"), (".L", "Left"),
+                                     ("_R", "Right"), (".R", "Right")]:
+            if key.name.endswith(suffix):
+                key.name = key.name[: -len(suffix)] + replacement
+                renamed += 1
+                break
+    return renamed
+
+
+class PANKO_OT_RenameLRSuffix(Operator):
+    """Rename shape key suffixes from _L / _R / .L / .R to Left / Right"""
+    bl_idname   = "panko.rename_lr_suffix"
+    bl_label    = "Rename L/R → Left/Right"
+    bl_description = "Convert _L, .L, _R, .R shape key suffixes to Left / Right"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def execute(self, context):
+        renamed = rename_lr_suffixes(context.active_object)
+        self.report({'INFO'}, f"Renamed {renamed} shape keys")
+        return {'FINISHED'}
+
+
+class PANKO_OT_SortShapeKeysAlpha(Operator):
+    """Sort all shape keys, keeping Basis first"""
+    bl_idname   = "panko.sort_shape_keys_alpha"
+    bl_label    = "Sort Shape Keys"
+    bl_description = "Sort shape keys A–Z, in ARKit order or in folder order; Basis stays at index 0"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    sort_mode: EnumProperty(name="Order", items=SORT_MODE_ITEMS, default='ALPHA')
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj and obj.type == 'MESH'
+                and obj.data.shape_keys
+                and len(obj.data.shape_keys.key_blocks) > 2)
+
+    def execute(self, context):
+        obj = context.active_object
+        kb  = obj.data.shape_keys.key_blocks
+
+        target = shape_sort_order([k.name for k in kb][1:], self.sort_mode, context.scene)
+        moves  = reorder_shape_keys(context, obj, target)
+
+        self.report({'INFO'}, f"Sorted {len(target)} shape keys with {moves} moves")
+        return {'FINISHED'}
+
+
+def reset_scope_meshes(context, whole_rig):
+    """Selected meshes, plus every mesh of their armatures when whole_rig is set."""
+    meshes = selected_meshes(context)
+    if whole_rig:
+        for arm in selected_armatures(context):
+            meshes += get_armature_meshes(arm)
+    return list(dict.fromkeys(meshes))
+
+
+class PANKO_OT_ResetBlendshapes(Operator):
+    """Reset all shape key values on the selected meshes"""
+    bl_idname   = "panko.reset_blendshapes"
+    bl_label    = "Reset Blendshapes"
+    bl_description = "Set all shape key values on the selected meshes to 0 or to the stored pose, skipping driven keys"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    mode: EnumProperty(name="Reset To", items=RESET_MODE_ITEMS, default='ZERO')
+    whole_rig: BoolProperty(
+        name="Whole Rig",
+        description="Also reset every mesh deformed by the selected (or selected meshes') armatures",
+        default=False,
+    )
+    skip_driven: BoolProperty(name="Skip Driven", description="Leave keys with drivers untouched", default=True)
+
+    @classmethod
+    def poll(cls, context):
+        return any(o.data.shape_keys for o in selected_meshes(context))
+
+    def execute(self, context):
+        meshes = reset_scope_meshes(context, self.whole_rig)
+        keys, changed = reset_shape_values(context.scene, meshes, self.mode, self.skip_driven)
+        self.report({'INFO'}, f"Reset {keys} shape keys on {changed} of {len(meshes)} meshes")
+        return {'FINISHED'}
+
+
+class PANKO_OT_StoreResetPose(Operator):
+    """Store the current shape key values of the selected meshes as the reset pose"""
+    bl_idname   = "panko.store_reset_pose"
+    bl_label    = "Store Reset Pose"
+    bl_description = "Remember the current shape key values of the selected meshes for Reset Blendshapes → Stored Pose"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    whole_rig: BoolProperty(
+        name="Whole Rig",
+        description="Also store every mesh deformed by the selected (or selected meshes') armatures",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(o.data.shape_keys for o in selected_meshes(context))
+
+    def execute(self, context):
+        stored = store_pose_snapshot(context.scene, reset_scope_meshes(context, self.whole_rig))
+        self.report({'INFO'}, f"Stored reset pose for {stored} meshes")
+        return {'FINISHED'}
+
+
+class PANKO_OT_FindReplaceShapeKeyNames(Operator):
+    """Find & replace text in shape key names"""
+    bl_idname   = "panko.find_replace_shape_key_names"
+    bl_label    = "Find & Replace Shape Key Names"
+    bl_description = "Find and replace text in all shape key names on the active mesh"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    find:    StringProperty(name="Find",    default="")
+    replace: StringProperty(name="Replace", default="")
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=360)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "find")
+        layout.prop(self, "replace")
+
+    def execute(self, context):
+        if not self.find:
+            self.report({'WARNING'}, "Find text cannot be empty!")
+            return {'CANCELLED'}
+        obj = context.active_object
+        renamed = 0
+        for key in obj.data.shape_keys.key_blocks:
+            if self.find in key.name:
+                key.name = key.name.replace(self.find, self.replace)
+                renamed += 1
+        self.report({'INFO'}, f"Renamed {renamed} shape keys")
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — EXP_ PREFIX ASSIGNER  (prefix: PANKO_OT_)
+# ==============================================================================
+
+# Rows ticked in the EXP_ list: {shape key datablock session_uid: {"names": set, "anchor": name}}
+_exp_selection = {}
+# Filter settings the EXP_ list last drew with: {session_uid: (name, invert, sort A–Z, bitflag)}
+_exp_list_filter = {}
+
+
+def get_exp_selection(shape_keys):
+    return _exp_selection.setdefault(shape_keys.session_uid, {"names": set(), "anchor": ""})
+
+
+def exp_ticked_names(shape_keys):
+    """Ticked names without creating a selection entry (for poll and draw)."""
+    selection = _exp_selection.get(shape_keys.session_uid)
+    return selection["names"] if selection else frozenset()
+
+
+def exp_list_filter(items, filter_name, invert, sort_alpha, bitflag):
+    """(flags, order) for the EXP_ list from the built-in UI_UL_list helpers; empty
+    lists when no filter or sort is active, so the list draws unfiltered for free."""
+    helper = bpy.types.UI_UL_list
+    flags = helper.filter_items_by_name(filter_name, bitflag, items, "name", reverse=invert) if filter_name else []
+    order = helper.sort_items_by_name(items, "name") if sort_alpha else []
+    return flags, order
+
+
+def exp_visible_rows(shape_keys):
+    """Key names the EXP_ list currently shows, in display order. Only computed when
+    a Shift-click needs the range, never per redraw."""
+    settings = _exp_list_filter.get(shape_keys.session_uid)
+    names = shape_keys.key_blocks.keys()
+    if not settings or not (settings[0] or settings[2]):
+        return names
+    flags, order = exp_list_filter(shape_keys.key_blocks, *settings)
+    shown = [i for i in range(len(names)) if not flags or flags[i] & settings[3]]
+    if order:
+        shown.sort(key=order.__getitem__)
+    return [names[i] for i in shown]
+
+
+def exp_display_name(name):
+    """Return (name without EXP_, has EXP_)."""
+    return (name[4:], True) if name.startswith("EXP_") else (name, False)
+
+
+def set_exp_prefix(key, enabled):
+    """Add or strip the EXP_ prefix on key, keeping its row ticked. Returns the new name."""
+    old = key.name
+    display, has_exp = exp_display_name(old)
+    if has_exp != enabled:
+        key.name = "EXP_" + old if enabled else display
+    selection = get_exp_selection(key.id_data)
+    if old in selection["names"]:
+        selection["names"].discard(old)
+        selection["names"].add(key.name)
+    if selection["anchor"] == old:
+        selection["anchor"] = key.name
+    return key.name
+
+
+@persistent
+def _clear_exp_selection_on_load(_dummy):
+    _exp_selection.clear()
+    _exp_list_filter.clear()
+
+
+class PANKO_OT_ToggleEXPPrefix(Operator):
+    """Toggle the EXP_ prefix on a single shape key"""
+    bl_idname   = "panko.toggle_exp_prefix"
+    bl_label    = "Toggle EXP_ Prefix"
+    bl_description = "Add or remove the EXP_ prefix on this shape key"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    shape_name: StringProperty()
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or not obj.data.shape_keys:
+            return {'CANCELLED'}
+        key = obj.data.shape_keys.key_blocks.get(self.shape_name)
+        if not key:
+            return {'CANCELLED'}
+        set_exp_prefix(key, not key.name.startswith("EXP_"))
+        return {'FINISHED'}
+
+
+class PANKO_OT_EXPSelectRow(Operator):
+    """Tick a row of the EXP_ list (Shift: tick the range from the last clicked row)"""
+    bl_idname   = "panko.exp_select_row"
+    bl_label    = "Select Row"
+    bl_description = "Tick or untick this shape key. Shift-click ticks every row from the last clicked one"
+
+    shape_name: StringProperty()
+    extend_range: BoolProperty(default=False, options={'SKIP_SAVE'})
+
+    def invoke(self, context, event):
+        self.extend_range = event.shift
+        return self.execute(context)
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or not obj.data.shape_keys:
+            return {'CANCELLED'}
+        shape_keys = obj.data.shape_keys
+        if shape_keys.key_blocks.find(self.shape_name) < 1:
+            return {'CANCELLED'}
+        selection = get_exp_selection(shape_keys)
+        names = selection["names"]
+        # Range over the rows the list shows (filter and sort applied), never hidden keys
+        visible = exp_visible_rows(shape_keys) if self.extend_range else []
+        if self.extend_range and selection["anchor"] in visible and self.shape_name in visible:
+            lo, hi = sorted((visible.index(selection["anchor"]), visible.index(self.shape_name)))
+            names.update(n for n in visible[lo:hi + 1] if n != shape_keys.reference_key.name)
+        elif self.shape_name in names:
+            names.discard(self.shape_name)
+        else:
+            names.add(self.shape_name)
+        selection["anchor"] = self.shape_name
+        return {'FINISHED'}
+
+
+class PANKO_OT_EXPSelectAll(Operator):
+    """Tick or untick every row of the EXP_ list"""
+    bl_idname   = "panko.exp_select_all"
+    bl_label    = "Select All Rows"
+    bl_description = "Tick or untick every shape key in the EXP_ list"
+
+    action: EnumProperty(items=[('SELECT', "Select", ""), ('DESELECT', "Deselect", "")])
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or not obj.data.shape_keys:
+            return {'CANCELLED'}
+        selection = get_exp_selection(obj.data.shape_keys)
+        selection["names"].clear()
+        if self.action == 'SELECT':
+            selection["names"].update(k.name for k in obj.data.shape_keys.key_blocks[1:])
+        return {'FINISHED'}
+
+
+class PANKO_OT_EXPToggleSelected(Operator):
+    """Toggle the EXP_ prefix on every ticked row"""
+    bl_idname   = "panko.exp_toggle_selected"
+    bl_label    = "Toggle Ticked"
+    bl_description = "Add EXP_ to all ticked shape keys, or remove it if they all have it already"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (obj and obj.type == 'MESH' and obj.data.shape_keys
+                and exp_ticked_names(obj.data.shape_keys))
+
+    def execute(self, context):
+        obj = context.active_object
+        kb = obj.data.shape_keys.key_blocks
+        keys = [kb[n] for n in list(exp_ticked_names(obj.data.shape_keys)) if n in kb]
+        enable = not all(exp_display_name(k.name)[1] for k in keys)
+        for key in keys:
+            set_exp_prefix(key, enable)
+        self.report({'INFO'}, f"{'Added' if enable else 'Removed'} EXP_ on {len(keys)} shape keys")
+        return {'FINISHED'}
+
+
+class PANKO_OT_EXPPrefixBatchAdd(Operator):
+    """Add EXP_ prefix to all non-Basis shape keys that don't already have it"""
+    bl_idname   = "panko.exp_prefix_batch_add"
+    bl_label    = "Add EXP_ to All"
+    bl_description = "Add EXP_ prefix to every shape key on the active mesh (except Basis)"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def execute(self, context):
+        obj = context.active_object
+        count = 0
+        for key in obj.data.shape_keys.key_blocks:
+            if key.name == "Basis" or key.name.startswith("EXP_"):
+                continue
+            key.name = "EXP_" + key.name
+            count += 1
+        self.report({'INFO'}, f"Added EXP_ to {count} shape keys")
+        return {'FINISHED'}
+
+
+class PANKO_OT_EXPPrefixBatchRemove(Operator):
+    """Remove EXP_ prefix from all shape keys that have it"""
+    bl_idname   = "panko.exp_prefix_batch_remove"
+    bl_label    = "Remove All EXP_"
+    bl_description = "Strip the EXP_ prefix from every shape key on the active mesh"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.data.shape_keys
+
+    def execute(self, context):
+        obj = context.active_object
+        count = 0
+        for key in obj.data.shape_keys.key_blocks:
+            if key.name.startswith("EXP_"):
+                key.name = key.name[4:]
+                count += 1
+        self.report({'INFO'}, f"Removed EXP_ from {count} shape keys")
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  OPERATORS — SETUP PIPELINE  (prefix: PANKO_OT_)
+# ==============================================================================
+
+class PipelineError(Exception):
+    """A pipeline stage could not run; the message names the stage."""
+
+
+class PipelineContext:
+    """Scene state resolved once and shared by every pipeline stage: the meshes to
+    work on, the VRM armature, its expression index and an ARKit shape → meshes map
+    that stages which add, rename or remove keys mark stale via shapes_changed()."""
+
+    def __init__(self, context, meshes=None):
+        self.meshes = list(meshes) if meshes is not None else selected_meshes(context)
+        self.active = context.active_object
+        _, self.armature_obj, vrm_ext = get_vrm_armature_and_extension()
+        self.index = VRMExpressionIndex(vrm_ext.vrm1.expressions) if self.armature_obj else None
+        self._vrm_meshes = None
+        self._shape_meshes = None
+
+    @property
+    def vrm_meshes(self):
+        if self._vrm_meshes is None:
+            self._vrm_meshes = get_vrm_shape_meshes(self.armature_obj) if self.armature_obj else []
+        return self._vrm_meshes
+
+    @property
+    def shape_meshes(self):
+        """ARKit shape → meshes over the VRM armature's meshes and the pipeline meshes."""
+        if self._shape_meshes is None:
+            meshes = dict.fromkeys(self.vrm_meshes + self.meshes)
+            self._shape_meshes = build_shape_mesh_index(
+                [o for o in meshes if o.data.shape_keys], ARKIT_BLENDSHAPES,
+            )
+        return self._shape_meshes
+
+    def shape_meshes_for(self, meshes):
+        """shape_meshes narrowed to the given meshes, without rescanning their keys."""
+        wanted = set(meshes)
+        return {n: [o for o in objs if o in wanted] for n, objs in self.shape_meshes.items()}
+
+    def shapes_changed(self):
+        self._vrm_meshes = None
+        self._shape_meshes = None
+
+    def require_vrm(self):
+        if self.index is None:
+            raise PipelineError("VRM armature not found!")
+
+    def require_shape_mesh(self):
+        # The active mesh, like the standalone operators; selection order is arbitrary
+        if self.active in self.meshes and self.active.data.shape_keys:
+            return self.active
+        mesh_obj = next((o for o in self.meshes if o.data.shape_keys), None)
+        if not mesh_obj:
+            raise PipelineError("No mesh with shape keys found!")
+        return mesh_obj
+
+
+def _stage_create(names):
+    def stage(pctx):
+        created, skipped = add_shape_keys(pctx.meshes, names)
+        pctx.shapes_changed()
+        return f"created {created}, skipped {skipped}"
+    return stage
+
+
+def _stage_add_to_vrm(pctx):
+    pctx.require_vrm()
+    created, skipped = add_arkit_expressions(pctx.armature_obj, pctx.index, pctx.require_shape_mesh())
+    return f"created {created} expressions, skipped {skipped}"
+
+
+def _stage_assign_selected(pctx):
+    pctx.require_vrm()
+    meshes = [pctx.require_shape_mesh()]
+    assigned, skipped = assign_arkit_binds(
+        pctx.armature_obj, pctx.index, meshes, shape_mesh=pctx.shape_meshes_for(meshes),
+    )
+    return f"assigned {assigned} binds, skipped {skipped}"
+
+
+def _stage_assign_proxies(pctx):
+    pctx.require_vrm()
+    meshes = pctx.vrm_meshes
+    assigned, skipped = assign_arkit_binds(
+        pctx.armature_obj, pctx.index, meshes, shape_mesh=pctx.shape_meshes_for(meshes),
+    )
+    return f"assigned {assigned} binds, skipped {skipped}"
+
+
+def _stage_rename_lr(pctx):
+    renamed = sum(rename_lr_suffixes(o) for o in pctx.meshes if o.data.shape_keys)
+    pctx.shapes_changed()
+    return f"renamed {renamed} shape keys"
+
+
+def _stage_remove_empty_vgroups(pctx):
+    return f"removed {sum(remove_empty_vertex_groups(o) for o in pctx.meshes)} vertex groups"
+
+
+def _stage_remove_empty_shapes(pctx):
+    removed = sum(len(remove_empty_shape_keys(o)) for o in pctx.meshes if o.data.shape_keys)
+    pctx.shapes_changed()
+    return f"removed {removed} shape keys"
+
+
+def _stage_cleanup_rig(pctx):
+    # The VRM armature, else whatever armatures deform the pipeline meshes
+    armatures = [pctx.armature_obj] if pctx.armature_obj else list(dict.fromkeys(
+        arm for arm in map(get_mesh_armature, pctx.meshes) if arm
+    ))
+    if not armatures:
+        return "skipped, no armature"
+    removed = sum(r for arm in armatures for _, r, _, _ in cleanup_rig_vertex_groups(arm))
+    return f"removed {removed} boneless vertex groups"
+
+
+# Stage id → (label, function); also the order stages run in from the operator
+PIPELINE_STAGES = {
+    "create_arkit":         ("Create ARKit Blendshapes",       _stage_create(ARKIT_BLENDSHAPES)),
+    "create_arkit_vrm":     ("Create ARKit + VRM Blendshapes", _stage_create(ARKIT_VRM_BLENDSHAPES)),
+    "add_to_vrm":           ("Add ARKit to VRM Expressions",   _stage_add_to_vrm),
+    "assign_selected":      ("Assign Selected Mesh",           _stage_assign_selected),
+    "assign_proxies":       ("Assign All Meshes",              _stage_assign_proxies),
+    "rename_lr":            ("Rename L/R → Left/Right",        _stage_rename_lr),
+    "remove_empty_vgroups": ("Remove Empty Vertex Groups",     _stage_remove_empty_vgroups),
+    "remove_empty_shapes":  ("Remove Empty Blendshapes",       _stage_remove_empty_shapes),
+    "cleanup_rig":          ("Clean Up Rig VGroups",           _stage_cleanup_rig),
+}
+PIPELINE_STAGE_ITEMS = [(k, label, "") for k, (label, _) in PIPELINE_STAGES.items()]
+DEFAULT_PIPELINE = {"create_arkit_vrm", "add_to_vrm", "assign_selected", "rename_lr", "remove_empty_vgroups"}
+
+
+def run_pipeline(context, stages, meshes=None):
+    """Run stage ids in the given order over one PipelineContext, as plain function
+    calls (no operator undo pushes or rescans in between). Yields
+    (stage, message, seconds) as each stage finishes; a failing stage raises
+    PipelineError and stops the run."""
+    pctx = PipelineContext(context, meshes)
+    for stage in stages:
+        label, fn = PIPELINE_STAGES[stage]
+        start = time.perf_counter()
+        try:
+            message = fn(pctx)
+        except PipelineError as e:
+            raise PipelineError(f"{label}: {e}") from e
+        yield stage, message, time.perf_counter() - start
+
+
+class PANKO_OT_RunPipeline(Operator):
+    """Run the chosen setup stages in order as a single undo step"""
+    bl_idname   = "panko.run_pipeline"
+    bl_label    = "Run Setup Pipeline"
+    bl_description = "Create, add to VRM, assign, rename and clean up in one go on the selected meshes, with one undo step"
+    bl_options  = {'REGISTER', 'UNDO'}
+
+    stages: EnumProperty(
+        name="Stages", items=PIPELINE_STAGE_ITEMS, options={'ENUM_FLAG'}, default=DEFAULT_PIPELINE,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return bool(selected_meshes(context))
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.layout.column(align=True).prop(self, "stages")
+
+    def execute(self, context):
+        order = [s for s in PIPELINE_STAGES if s in self.stages]
+        start = time.perf_counter()
+        done = 0
+        try:
+            for stage, message, seconds in run_pipeline(context, order):
+                done += 1
+                self.report({'INFO'}, f"{PIPELINE_STAGES[stage][0]}: {message} ({seconds * 1000:.0f} ms)")
+        except PipelineError as e:
+            self.report({'ERROR'}, str(e))
+            return {'FINISHED'} if done else {'CANCELLED'}
+        self.report({'INFO'}, f"Pipeline: {done} stages in {time.perf_counter() - start:.2f}s")
+        return {'FINISHED'}
+
+
+# ==============================================================================
+#  UI PANEL — ANGELUS ARKIT HELPER  (tab: "ARKit H")
+# ==============================================================================
+
+class AK_UL_targets(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if item.obj:
+            layout.label(text=item.obj.name, icon='MESH_DATA')
+
+
+class PANKO_UL_exp_prefix(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index == 0:
+            layout.label(text=item.name, icon='SHAPEKEY_DATA')
+            return
+        display, has_exp = exp_display_name(item.name)
+        ticked = item.name in exp_ticked_names(data)
+        row = layout.row(align=True)
+        row.operator(
+            "panko.exp_select_row", text="", emboss=False,
+            icon='CHECKBOX_HLT' if ticked else 'CHECKBOX_DEHLT',
+        ).shape_name = item.name
+        # Show clean display name; operator gets the actual key name
+        row.operator(
+            "panko.toggle_exp_prefix", text=display,
+            icon='PROP_ON' if has_exp else 'PROP_OFF', emboss=has_exp,
+        ).shape_name = item.name
+
+    def filter_items(self, context, data, propname):
+        # Default name filter / A–Z sort; only the settings are remembered so a Shift
+        # range-tick can rebuild the visible order when it happens
+        settings = (self.filter_name, self.use_filter_invert, self.use_filter_sort_alpha,
+                    self.bitflag_filter_item)
+        _exp_list_filter[data.session_uid] = settings
+        return exp_list_filter(getattr(data, propname), *settings)
+
+
+class AK_PT_panel(Panel):
+    bl_label      = "ARKit Blendshape Helper"
+    bl_idname     = "AK_PT_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category   = "ARKit H"
+
+    def draw(self, context):
+        layout = self.layout
+        scene  = context.scene
+        master_obj = scene.ak_driver_mesh
+
+        # — Mesh Setup ————————————————————————————
+        m_box = layout.box()
+        m_box.prop(
+            scene, "ak_show_mesh_setup",
+            icon='TRIA_DOWN' if scene.ak_show_mesh_setup else 'TRIA_RIGHT',
+            text="Mesh Setup", emboss=False,
+        )
+        if scene.ak_show_mesh_setup:
+            col = m_box.column(align=True)
+            col.prop(scene, "ak_driver_mesh", text="Driver")
+            row = col.row()
+            row.template_list("AK_UL_targets", "", scene, "ak_targets", scene, "ak_target_index")
+            btns = row.column(align=True)
+            btns.operator("ak.target_add_selected", icon='ADD',    text="")
+            btns.operator("ak.target_remove",       icon='REMOVE', text="")
+
+            row = col.row(align=True)
+            row.operator("ak.add_arkit_shapes", icon='SHAPEKEY_DATA',       text="Add ARKit")
+            row.operator("ak.add_vrm_shapes",   icon='OUTLINER_OB_ARMATURE', text="Add VRM")
+            row.operator("ak.delete_all_shapes", icon='ERROR',              text="")
+
+        # — Global Controls ————————————————————————
+        row = layout.row(align=True)
+        row.operator("ak.create_drivers", icon='CONSTRAINT', text="Driver Link")
+        row.operator("ak.remove_drivers", icon='CANCEL',     text="Driver Unlink")
+        row.prop(scene, "ak_link_mode", text="")
+        row = layout.row(align=True)
+        row.operator("ak.select_all_meshes", icon='RESTRICT_SELECT_OFF', text="Select")
+        row.operator("ak.select_basis",      icon='SHAPEKEY_DATA',       text="Basis")
+        row.operator("ak.global_zero",       icon='FILE_REFRESH',        text="Zero All")
+
+        # — Pose Snapshots ——————————————————————
+        p_box = layout.box()
+        p_box.prop(
+            scene, "ak_show_pose_setup",
+            icon='TRIA_DOWN' if scene.ak_show_pose_setup else 'TRIA_RIGHT',
+            text="Pose Snapshots", emboss=False,
+        )
+        if scene.ak_show_pose_setup:
+            col = p_box.column(align=True)
+            row = col.row(align=True)
+            row.prop(scene, "ak_pose_name", text="")
+            row.operator("ak.store_pose", icon='DECORATE_KEYFRAME', text="Store").pose_name = scene.ak_pose_name
+            if scene.ak_pose_active != 'NONE':
+                row = col.row(align=True)
+                row.prop(scene, "ak_pose_active", text="")
+                op = row.operator("ak.global_zero", icon='LOOP_BACK', text="Restore")
+                op.mode, op.pose_name = 'SNAPSHOT', scene.ak_pose_active
+                row.operator("ak.delete_pose", icon='X', text="").pose_name = scene.ak_pose_active
+                row = col.row(align=True)
+                row.prop(scene, "ak_pose_blend_a", text="")
+                row.prop(scene, "ak_pose_blend_b", text="")
+                col.prop(scene, "ak_pose_blend", slider=True)
+
+        if not master_obj or not master_obj.data.shape_keys:
+            layout.label(text="Assign a Driver Mesh with shapes.", icon='INFO')
+            return
+
+        # — Split Settings ——————————————————————
+        s_box = layout.box()
+        s_box.prop(
+            scene, "ak_show_split_setup",
+            icon='TRIA_DOWN' if scene.ak_show_split_setup else 'TRIA_RIGHT',
+            text="Split Settings", emboss=False,
+        )
+        if scene.ak_show_split_setup:
+            col = s_box.column(align=True)
+            col.row(align=True).prop(scene, "ak_split_axis", expand=True)
+            if scene.ak_split_axis == 'BONE':
+                arm_obj = get_mesh_armature(master_obj)
+                if arm_obj:
+                    col.prop_search(scene, "ak_split_bone", arm_obj.data, "bones", text="Bone")
+                else:
+                    col.label(text="Driver has no Armature modifier.", icon='ERROR')
+            col.prop(scene, "ak_split_blend_width", text="Blend Width")
+            col.prop_search(scene, "ak_split_vertex_group", master_obj, "vertex_groups", text="Mask")
+
+        # — Blendshape Folders ————————————————————
+        f_box  = layout.box()
+        header = f_box.row()
+        header.prop(
+            scene, "ak_show_folders_setup",
+            icon='TRIA_DOWN' if scene.ak_show_folders_setup else 'TRIA_RIGHT',
+            text="Blendshape Folders", emboss=False,
+        )
+        sub = header.row(align=True)
+        sub.operator("ak.split_all_unmirrored", icon='MOD_MIRROR', text="")
+        sub.operator("ak.sort_rig_canonical",   icon='SORTALPHA',  text="")
+        sub.operator("ak.autosort_shapes", icon='FILE_REFRESH', text="")
+
+        if scene.ak_show_folders_setup:
+            row = f_box.row(align=True)
+            row.prop(scene, "ak_folder_filter", text="", icon='VIEWZOOM')
+            row.prop(scene, "ak_folder_page_size", text="Rows")
+            key_blocks = master_obj.data.shape_keys.key_blocks
+            active_idx = master_obj.active_shape_key_index
+            page_size  = scene.ak_folder_page_size
+            ensure_folder_rows(scene)
+            for group in scene.ak_groups:
+                rows   = get_folder_rows(scene, group.name, scene.ak_folder_filter)
+                g_box  = f_box.box()
+                header = g_box.row(align=True)
+                header.prop(
+                    group, "is_expanded",
+                    icon='TRIA_DOWN' if group.is_expanded else 'TRIA_RIGHT',
+                    text=f"{group.name} ({len(rows)})", emboss=False,
+                )
+                if group.is_expanded:
+                    pages = max(1, -(-len(rows) // page_size))
+                    page  = min(group.page, pages - 1)
+                    if pages > 1:
+                        nav = header.row(align=True)
+                        btn = nav.row(align=True)
+                        btn.enabled = page > 0
+                        op = btn.operator("ak.folder_page", text="", icon='TRIA_LEFT')
+                        op.group_name, op.step, op.pages = group.name, -1, pages
+                        nav.label(text=f"{page + 1}/{pages}")
+                        btn = nav.row(align=True)
+                        btn.enabled = page < pages - 1
+                        op = btn.operator("ak.folder_page", text="", icon='TRIA_RIGHT')
+                        op.group_name, op.step, op.pages = group.name, 1, pages
+                    col = g_box.column(align=True)
+                    for s_n, idx, side in rows[page * page_size:(page + 1) * page_size]:
+                        kb = key_blocks[idx] if idx < len(key_blocks) else None
+                        if not kb or kb.name != s_n:
+                            continue
+                        is_active = active_idx == idx
+                        row = col.row(align=True)
+                        if side == 'LEFT':
+                            row.separator(factor=1.6)
+                            row.label(icon='EVENT_L')
+                        elif side == 'RIGHT':
+                            row.separator(factor=1.6)
+                            row.label(icon='EVENT_R')
+                        else:
+                            row.operator("ak.mirror_blendshape", text="", icon='MOD_MIRROR').shape_name = s_n
+                        row.prop(kb, "value", text=s_n)
+                        row.operator("ak.add_single_arkit_shape", text="", icon='ADD').shape_name = s_n
+                        row.operator(
+                            "ak.select_shape_key", text="",
+                            icon='RESTRICT_SELECT_OFF' if is_active else 'RESTRICT_SELECT_ON',
+                        ).shape_name = s_n
+                        row.operator("ak.delete_single_shape", text="", icon='X').shape_name = s_n
+
+
+# ==============================================================================
+#  UI PANELS — HELPER SCRIPTS  (tab: "Helper Scripts")
+# ==============================================================================
+
+class PANKO_PT_VRMTools(Panel):
+    bl_label      = "VRM Expression Tools"
+    bl_idname     = "PANKO_PT_VRMTools"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category   = "Helper Scripts"
+
+    def draw(self, context):
+        layout = self.layout
+
+        layout.operator("panko.run_pipeline", icon='PLAY')
+
+        box = layout.box()
+        box.label(text="Create Blendshapes", icon='SHAPEKEY_DATA')
+        box.operator("panko.create_arkit_blendshapes",     icon='ADD')
+        box.operator("panko.create_arkit_vrm_blendshapes", icon='ADD')
+        box.operator("panko.add_custom_blendshape",        icon='SOLO_ON')
+        box.operator("panko.add_multiple_custom_blendshapes", icon='PRESET_NEW')
+
+        box = layout.box()
+        box.label(text="Shape Delta Files", icon='FILE')
+        row = box.row(align=True)
+        row.operator("panko.export_shape_deltas", icon='EXPORT', text="Export")
+        row.operator("panko.import_shape_deltas", icon='IMPORT', text="Import")
+
+        box = layout.box()
+        box.label(text="VRM Expression Setup", icon='ARMATURE_DATA')
+        box.operator("panko.add_arkit_to_vrm",            icon='EXPORT')
+        box.operator("panko.add_custom_blendshape_to_vrm", icon='PLUS')
+
+        box = layout.box()
+        box.label(text="Assign to VRM Proxies", icon='LINKED')
+        box.operator("panko.assign_blendshapes_proxies",    icon='CONSTRAINT')
+        box.operator("panko.assign_selected_mesh_proxies",  icon='MESH_DATA')
+
+
+class PANKO_PT_MeshCleanup(Panel):
+    bl_label      = "Mesh Cleanup"
+    bl_idname     = "PANKO_PT_MeshCleanup"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category   = "Helper Scripts"
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Blendshape Cleanup", icon='SHAPEKEY_DATA')
+        box.operator("panko.remove_empty_blendshapes", icon='X')
+        row = box.row(align=True)
+        row.operator("panko.reset_blendshapes",        icon='LOOP_BACK')
+        row.operator("panko.store_reset_pose",         icon='DECORATE_KEYFRAME', text="")
+
+        box = layout.box()
+        box.label(text="Vertex Group Cleanup", icon='GROUP_VERTEX')
+        box.operator("panko.remove_empty_vertex_groups",         icon='X')
+        box.operator("panko.remove_unassigned_bone_vgroups",     icon='BONE_DATA')
+        box.operator("panko.cleanup_rig_vertex_groups",          icon='ARMATURE_DATA')
+
+
+class PANKO_PT_ShapeKeyStats(Panel):
+    bl_label      = "Shape Key Stats"
+    bl_idname     = "PANKO_PT_ShapeKeyStats"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category   = "Helper Scripts"
+    bl_options    = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            layout.label(text="Select a mesh with shape keys.", icon='INFO')
+            return
+
+        layout.operator("panko.analyze_shape_keys", icon='FILE_REFRESH')
+        stats = peek_mesh_delta_stats(obj.data)
+        if not stats:
+            layout.label(text="Not analyzed yet.", icon='INFO')
+            return
+
+        active = obj.active_shape_key
+        active_stats = stats.get(active.name) if active else None
+        if active_stats and active_stats.bbox_min:
+            box = layout.box()
+            box.label(text=active.name, icon='SHAPEKEY_DATA')
+            box.label(text="Min: ({:.3f}, {:.3f}, {:.3f})".format(*active_stats.bbox_min))
+            box.label(text="Max: ({:.3f}, {:.3f}, {:.3f})".format(*active_stats.bbox_max))
+
+        col = layout.column(align=True)
+        row = col.row()
+        row.label(text="Shape")
+        row.label(text="Max")
+        row.label(text="Verts")
+        row.label(text="Side")
+        for name, st in stats.items():
+            row = col.row()
+            row.alert = st.side == 'NONE'
+            row.label(text=name)
+            row.label(text=f"{st.max_displacement:.4f}")
+            row.label(text=str(st.affected_count))
+            row.label(text=st.side.title())
+
+
+class PANKO_PT_NamingTools(Panel):
+    bl_label      = "Naming & Sorting"
+    bl_idname     = "PANKO_PT_NamingTools"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category   = "Helper Scripts"
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Shape Key Names", icon='SORTALPHA')
+        box.operator("panko.rename_lr_suffix",              icon='ARROW_LEFTRIGHT')
+        box.operator("panko.find_replace_shape_key_names",  icon='VIEWZOOM')
+        box.operator_menu_enum("panko.sort_shape_keys_alpha", "sort_mode", text="Sort Shape Keys", icon='SORTALPHA')
+
+
+class PANKO_PT_ExpressionPrefixer(Panel):
+    bl_label      = "EXP_ Prefix Assigner"
+    bl_idname     = "PANKO_PT_ExpressionPrefixer"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category   = "Helper Scripts"
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
+            layout.label(text="Select a mesh with shape keys.", icon='INFO')
+            return
+
+        # Batch controls
+        row = layout.row(align=True)
+        row.operator("panko.exp_prefix_batch_add",    icon='ADD',    text="Tag All")
+        row.operator("panko.exp_prefix_batch_remove", icon='REMOVE', text="Untag All")
+
+        layout.separator(factor=0.5)
+
+        # Per-shape toggle list — only visible rows are drawn; type in the filter to search
+        layout.template_list(
+            "PANKO_UL_exp_prefix", "", obj.data.shape_keys, "key_blocks",
+            obj, "active_shape_key_index", rows=12,
+        )
+        ticked = len(exp_ticked_names(obj.data.shape_keys))
+        row = layout.row(align=True)
+        row.operator("panko.exp_select_all", icon='CHECKBOX_HLT',   text="All").action = 'SELECT'
+        row.operator("panko.exp_select_all", icon='CHECKBOX_DEHLT', text="None").action = 'DESELECT'
+        row.operator("panko.exp_toggle_selected", icon='ARROW_LEFTRIGHT', text=f"Toggle Ticked ({ticked})")
+
+
+# ==============================================================================
+#  REGISTER
+# ==============================================================================
+
+classes = [
+    # Data models
+    AK_ShapeRef,
+    AK_GroupItem,
+    AK_Target,
+    # UI lists
+    AK_UL_targets,
+    PANKO_UL_exp_prefix,
+    # Angelus operators
+    AK_OT_select_shape_key,
+    AK_OT_add_arkit_shapes,
+    AK_OT_add_vrm_shapes,
+    AK_OT_autosort_shapes,
+    AK_OT_mirror_blendshape,
+    AK_OT_split_all_unmirrored,
+    AK_OT_sort_rig_canonical,
+    AK_OT_select_all_meshes,
+    AK_OT_create_drivers,
+    AK_OT_remove_drivers,
+    AK_OT_select_basis,
+    AK_OT_global_zero,
+    AK_OT_store_pose,
+    AK_OT_delete_pose,
+    AK_OT_delete_all_shapes,
+    AK_OT_target_add_selected,
+    AK_OT_target_remove,
+    AK_OT_groups_toggle,
+    AK_OT_folder_page,
+    AK_OT_delete_single_shape,
+    AK_OT_add_single_arkit_shape,
+    # VRM tool operators
+    PANKO_OT_CreateARKitBlendshapes,
+    PANKO_OT_CreateARKitVRMBlendshapes,
+    PANKO_OT_AddARKitToVRMExpressions,
+    PANKO_OT_AssignBlendshapesToProxies,
+    PANKO_OT_AssignSelectedMeshBlendshapesToProxies,
+    PANKO_OT_AddCustomBlendshape,
+    PANKO_OT_AddMultipleCustomBlendshapes,
+    PANKO_OT_AddCustomBlendshapeToVRM,
+    # Shape delta file operators
+    PANKO_OT_ExportShapeDeltas,
+    PANKO_OT_ImportShapeDeltas,
+    # Mesh cleanup operators
+    PANKO_OT_RemoveEmptyBlendshapes,
+    PANKO_OT_AnalyzeShapeKeys,
+    PANKO_OT_RemoveEmptyVertexGroups,
+    PANKO_OT_RemoveUnassignedBoneVertexGroups,
+    PANKO_OT_CleanupRigVertexGroups,
+    # Naming & sorting operators
+    PANKO_OT_RenameLRSuffix,
+    PANKO_OT_SortShapeKeysAlpha,
+    PANKO_OT_ResetBlendshapes,
+    PANKO_OT_StoreResetPose,
+    PANKO_OT_FindReplaceShapeKeyNames,
+    # EXP_ prefix operators
+    PANKO_OT_ToggleEXPPrefix,
+    PANKO_OT_EXPSelectRow,
+    PANKO_OT_EXPSelectAll,
+    PANKO_OT_EXPToggleSelected,
+    PANKO_OT_EXPPrefixBatchAdd,
+    PANKO_OT_EXPPrefixBatchRemove,
+    PANKO_OT_RunPipeline,
+    # Panels
+    AK_PT_panel,
+    PANKO_PT_VRMTools,
+    PANKO_PT_MeshCleanup,
+    PANKO_PT_ShapeKeyStats,
+    PANKO_PT_NamingTools,
+    PANKO_PT_ExpressionPrefixer,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+    s = bpy.types.Scene
+    s.ak_driver_mesh       = PointerProperty(type=bpy.types.Object, name="Driver")
+    s.ak_targets           = CollectionProperty(type=AK_Target)
+    s.ak_target_index      = IntProperty()
+    s.ak_groups            = CollectionProperty(type=AK_GroupItem)
+    s.ak_show_mesh_setup   = BoolProperty(default=True)
+    s.ak_show_folders_setup = BoolProperty(default=True)
+    s.ak_show_split_setup  = BoolProperty(default=False)
+    s.ak_show_pose_setup   = BoolProperty(default=False)
+    s.ak_pose_name         = StringProperty(name="Pose Name", default=RESET_POSE_NAME)
+    s.ak_pose_active       = EnumProperty(name="Pose", items=pose_snapshot_items)
+    s.ak_pose_blend_a      = EnumProperty(name="Blend From", items=pose_snapshot_items)
+    s.ak_pose_blend_b      = EnumProperty(name="Blend To",   items=pose_snapshot_items)
+    s.ak_pose_blend        = FloatProperty(
+        name="Blend", description="Interpolate the Driver and Targets from the first pose (0) to the second (1)",
+        default=0.0, min=0.0, max=1.0, update=_update_pose_blend,
+    )
+    s.ak_folder_filter     = StringProperty(name="Filter", description="Only show shapes whose name contains this text")
+    s.ak_folder_page_size  = IntProperty(name="Rows per Page", default=30, min=5, max=500)
+    s.ak_link_mode         = EnumProperty(name="Link Mode", items=LINK_MODE_ITEMS, default='DRIVERS')
+    s.ak_link_sync         = BoolProperty(name="Bulk Sync Active", default=False)
+    s.ak_split_axis        = EnumProperty(name="Split Axis", items=SPLIT_AXIS_ITEMS, default='X')
+    s.ak_split_bone        = StringProperty(name="Split Bone", description="Bone whose X axis defines the split plane")
+    s.ak_split_blend_width = FloatProperty(
+        name="Blend Width",
+        description="Width of the cross-fade across the split plane (0 = hard split)",
+        default=0.0, min=0.0, soft_max=0.1, precision=4, subtype='DISTANCE',
+    )
+    s.ak_split_vertex_group = StringProperty(
+        name="Mask Group", description="Optional vertex group that scales both split halves",
+    )
+
+    bpy.app.handlers.load_post.append(_clear_delta_stats_on_load)
+    bpy.app.handlers.load_post.append(_vrm_cache_reset)
+    bpy.app.handlers.load_post.append(_clear_exp_selection_on_load)
+    bpy.app.handlers.undo_post.append(_vrm_cache_reset)
+    bpy.app.handlers.redo_post.append(_vrm_cache_reset)
+    bpy.app.handlers.load_post.append(_folder_index_reset)
+    bpy.app.handlers.load_post.append(_migrate_folder_csv_on_load)
+    bpy.app.handlers.undo_post.append(_folder_index_reset)
+    bpy.app.handlers.redo_post.append(_folder_index_reset)
+    bpy.app.handlers.depsgraph_update_post.append(_vrm_cache_depsgraph_update)
+    bpy.app.handlers.load_post.append(_link_sync_reset)
+    bpy.app.handlers.load_post.append(_clear_pose_cache)
+    bpy.app.handlers.undo_post.append(_clear_pose_cache)
+    bpy.app.handlers.redo_post.append(_clear_pose_cache)
+    bpy.app.handlers.undo_post.append(_link_sync_reset)
+    bpy.app.handlers.redo_post.append(_link_sync_reset)
+    bpy.app.handlers.frame_change_post.append(_link_sync_update)
+    bpy.app.handlers.depsgraph_update_post.append(_link_sync_update)
+    bpy.app.timers.register(_migrate_folder_csv_deferred, first_interval=0.0)
+
+
+def unregister():
+    for handlers, fn in [
+        (bpy.app.handlers.load_post,             _clear_delta_stats_on_load),
+        (bpy.app.handlers.load_post,             _vrm_cache_reset),
+        (bpy.app.handlers.load_post,             _clear_exp_selection_on_load),
+        (bpy.app.handlers.undo_post,             _vrm_cache_reset),
+        (bpy.app.handlers.redo_post,             _vrm_cache_reset),
+        (bpy.app.handlers.load_post,             _folder_index_reset),
+        (bpy.app.handlers.load_post,             _migrate_folder_csv_on_load),
+        (bpy.app.handlers.undo_post,             _folder_index_reset),
+        (bpy.app.handlers.redo_post,             _folder_index_reset),
+        (bpy.app.handlers.depsgraph_update_post, _vrm_cache_depsgraph_update),
+        (bpy.app.handlers.load_post,             _link_sync_reset),
+        (bpy.app.handlers.load_post,             _clear_pose_cache),
+        (bpy.app.handlers.undo_post,             _clear_pose_cache),
+        (bpy.app.handlers.redo_post,             _clear_pose_cache),
+        (bpy.app.handlers.undo_post,             _link_sync_reset),
+        (bpy.app.handlers.redo_post,             _link_sync_reset),
+        (bpy.app.handlers.frame_change_post,     _link_sync_update),
+        (bpy.app.handlers.depsgraph_update_post, _link_sync_update),
+    ]:
+        if fn in handlers:
+            handlers.remove(fn)
+    if bpy.app.timers.is_registered(_migrate_folder_csv_deferred):
+        bpy.app.timers.unregister(_migrate_folder_csv_deferred)
+    _delta_stats_cache.clear()
+    _exp_selection.clear()
+    _exp_list_filter.clear()
+    invalidate_vrm_scene_cache()
+    invalidate_folder_index()
+    invalidate_link_sync_plan()
+    _pose_values_cache.clear()
+
+    s = bpy.types.Scene
+    del s.ak_driver_mesh
+    del s.ak_targets
+    del s.ak_target_index
+    del s.ak_groups
+    del s.ak_show_mesh_setup
+    del s.ak_show_folders_setup
+    del s.ak_show_split_setup
+    del s.ak_show_pose_setup
+    del s.ak_pose_name
+    del s.ak_pose_active
+    del s.ak_pose_blend_a
+    del s.ak_pose_blend_b
+    del s.ak_pose_blend
+    del s.ak_folder_filter
+    del s.ak_folder_page_size
+    del s.ak_link_mode
+    del s.ak_link_sync
+    del s.ak_split_axis
+    del s.ak_split_bone
+    del s.ak_split_blend_width
+    del s.ak_split_vertex_group
+
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+
+
+if __name__ == "__main__":
+    register()